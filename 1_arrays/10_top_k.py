@@ -0,0 +1,227 @@
+"""
+10_top_k.py
+Top-k selection without sorting everything (get_top_n in 5_array_use_cases.py sorts the
+whole list to keep n items).
+- TopK: bounded min-heap of k entries over a stream, O(N log k) time and O(k) memory;
+  states from different partitions merge into the same answer as one pass
+- top_k(): one-shot over any iterable; quickselect_top_k(): in-place selection for an
+  in-memory list (or NumPy array) in O(N) average comparisons. On a list the Python-level
+  loop makes it slower than sorted() in practice; it only pays off on NumPy arrays, where
+  the selection runs in C (np.partition) and only the k winners are sorted
+- top_k_parallel(): top-k per partition in worker processes, merged in the parent
+Results are always sorted best-first and match sorted(data, key=key, reverse=True)[:k]:
+ties keep input order (the earliest item wins). quickselect_top_k reorders its input and
+is only stable for ties of indistinguishable values (e.g. plain numbers without a key).
+The heap wins while k is small next to N, but its per-item cost grows with log k: on 1M
+random floats, sorting catches up around k = N/20 for top_k and k = N/50 for TopK, and
+at k = N/10 the heap is 2-6x slower. top_k and TopK.push_many therefore sort a sized
+input outright once k >= len / _SORT_AT; streams always use the heap.
+"""
+
+import heapq
+import random
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+
+_SORT_AT = 32  # sort a sized input outright once k >= len / _SORT_AT (see above)
+
+
+class TopK:
+    def __init__(self, k, key=None, start=0):
+        # entries are (key, -position, item): the heap root is the entry to evict next,
+        # i.e. the smallest key and, among equal keys, the latest position
+        self.k = k
+        self.key = key
+        self.seen = start  # global position of the next pushed item
+        self._heap = []
+
+    def _offer(self, entry):
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def _absorb(self, entries):
+        # entries are unique on (key, -position), so tuples never compare the items
+        if len(entries) < 8:
+            for entry in entries:
+                self._offer(entry)
+            return
+        merged = self._heap + list(entries)
+        if len(merged) > self.k:
+            merged = heapq.nlargest(self.k, merged)
+        heapq.heapify(merged)
+        self._heap = merged
+
+    def push(self, item):
+        pos = self.seen
+        self.seen += 1
+        if self.k > 0:
+            self._offer((self.key(item) if self.key else item, -pos, item))
+
+    def push_many(self, items):
+        # the batch's own top k comes from heapq.nlargest (bounded heap in C), then
+        # joins the running heap; items is consumed once, in order
+        if self.k > 0 and isinstance(items, Sequence) and self.k * _SORT_AT >= len(items):
+            return self._push_sorted(items)
+        positions = count(self.seen)
+        key = self.key
+        if key is None:
+            entries = ((x, -p, x) for x, p in zip(items, positions))
+        else:
+            entries = ((key(x), -p, x) for x, p in zip(items, positions))
+        if self.k > 0:
+            self._absorb(heapq.nlargest(self.k, entries))
+        else:
+            deque(entries, maxlen=0)
+        self.seen = next(positions)  # items is exhausted first, so this is seen + len(items)
+        return self
+
+    def _push_sorted(self, items):
+        # large k: one C sort of the batch's indices by key; the sort is stable, so ties
+        # keep the earliest position first, as the heap order does
+        keys = items if self.key is None else [self.key(x) for x in items]
+        best = sorted(range(len(items)), key=keys.__getitem__, reverse=True)[:self.k]
+        start = self.seen
+        self._absorb([(keys[i], -(start + i), items[i]) for i in best])
+        self.seen = start + len(items)
+        return self
+
+    def merge(self, other):
+        # positions are global, so ties resolve exactly as in a single pass
+        if self.k > 0:
+            self._absorb(other._heap)
+        self.seen = max(self.seen, other.seen)
+        return self
+
+    def result(self):
+        return [e[2] for e in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __getstate__(self):
+        # the key function is not needed (or picklable, if a lambda) once keys are computed
+        return self.k, self.seen, self._heap
+
+    def __setstate__(self, state):
+        self.k, self.seen, self._heap = state
+        self.key = None
+
+
+def top_k(iterable, k, key=None):
+    # heapq.nlargest is the same bounded heap, with the inner loop in C
+    if isinstance(iterable, Sequence) and k * _SORT_AT >= len(iterable):
+        return sorted(iterable, key=key, reverse=True)[:max(k, 0)]
+    return heapq.nlargest(k, iterable, key=key)
+
+
+def quickselect_top_k(arr, k, key=None):
+    """Reorder arr so arr[:k] holds its k largest items, and return them best-first."""
+    n = len(arr)
+    k = max(0, min(k, n))
+    if not k:
+        return []
+    if hasattr(arr, "partition") and key is None:  # NumPy: introselect in C
+        arr.partition(n - k)  # k largest now at the end
+        top = arr[n - k:].copy()
+        # swap the tail into the front: only min(k, n - k) displaced items move
+        arr[max(k, n - k):] = arr[:min(k, n - k)].copy()
+        top.sort()
+        arr[:k] = top[::-1]
+        return arr[:k].tolist()
+    keyf = key or (lambda x: x)
+    rng = random.Random(k)
+    lo, hi = 0, n - 1
+    while lo < hi:
+        # three-way partition of arr[lo:hi+1] around a random pivot: > pivot, == pivot, < pivot
+        pivot = keyf(arr[rng.randint(lo, hi)])
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            v = keyf(arr[i])
+            if v > pivot:
+                arr[lt], arr[i] = arr[i], arr[lt]
+                lt += 1
+                i += 1
+            elif v < pivot:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                gt -= 1
+            else:
+                i += 1
+        if k - 1 < lt:
+            hi = lt - 1
+        elif k - 1 > gt:
+            lo = gt + 1
+        else:
+            break
+    head = arr[:k]
+    head.sort(key=key, reverse=True)
+    arr[:k] = head
+    return list(head)
+
+
+def _partition_top_k(part, k, key, start):
+    return TopK(k, key, start).push_many(part)
+
+
+def top_k_parallel(partitions, k, key=None, processes=None):
+    """Top-k over a list of sequences; key must be picklable (a module-level function)."""
+    partitions = list(partitions)
+    starts, offset = [], 0
+    for part in partitions:
+        starts.append(offset)
+        offset += len(part)
+    result = TopK(k, key)
+    if processes == 0 or len(partitions) < 2:
+        for part, start in zip(partitions, starts):
+            result.merge(_partition_top_k(part, k, key, start))
+        return result.result()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(_partition_top_k, part, k, key, start)
+                   for part, start in zip(partitions, starts)]
+        for fut in futures:
+            result.merge(fut.result())
+    return result.result()
+
+
+if __name__ == "__main__":
+    import time
+    from operator import itemgetter
+
+    scores = [70, 85, 90, 55, 60]
+    print("Top 3 scores:", top_k(scores, 3), quickselect_top_k(list(scores), 3))
+    players = [("ann", 90), ("bob", 85), ("cid", 90), ("dee", 70), ("eve", 90)]
+    stream = TopK(2, key=itemgetter(1)).push_many(iter(players))
+    print("Top 2 players (ties keep input order):", stream.result())
+    print("Merged from partitions:", top_k_parallel([players[:2], players[2:]], 2,
+                                                   key=itemgetter(1), processes=0))
+
+    rng = random.Random(0)
+    for n in (100_000, 1_000_000):
+        data = [rng.random() for _ in range(n)]
+        for k in (10, 1_000, n // 10):
+            timings = {}
+            for label, fn in (
+                ("sorted", lambda: sorted(data, reverse=True)[:k]),
+                ("TopK", lambda: TopK(k).push_many(data).result()),
+                ("top_k", lambda: top_k(data, k)),
+                ("quickselect", lambda: quickselect_top_k(list(data), k)),
+                ("parallel x4", lambda: top_k_parallel(
+                    [data[i * n // 4:(i + 1) * n // 4] for i in range(4)], k, processes=4)),
+            ):
+                t0 = time.perf_counter()
+                fn()
+                timings[label] = time.perf_counter() - t0
+            print(f"N={n:>9,} k={k:>7,}: " + "  ".join(f"{lbl} {t:.3f}s" for lbl, t in timings.items()))
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        arr = np.random.default_rng(0).random(1_000_000)
+        t0 = time.perf_counter()
+        quickselect_top_k(arr, 1_000)
+        print(f"quickselect on a 1,000,000-item NumPy array, k=1,000: {time.perf_counter() - t0:.3f}s")
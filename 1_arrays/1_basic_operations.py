@@ -1,6 +1,7 @@
 """
 1_basic_operations.py
 Basic list operations: creation, append, insert, remove, update, search, length, clear, reverse, copy
+All helpers also accept an IndexedList (6_indexed_list.py) for O(1) search and fast inserts.
 """
 
 def create_list():
@@ -15,8 +16,10 @@ def insert_element(lst, index, element):
     return lst
 
 def remove_element(lst, element):
-    if element in lst:
-        lst.remove(element)
+    try:
+        lst.remove(element)  # single scan; `in` + remove() walked the list twice
+    except ValueError:
+        pass
     return lst
 
 def update_element(lst, index, new_value):
@@ -1,5 +1,46 @@
 
 ## List slicing and indexing techniques: slice, step, negative indices, sublists, combinations
+## ListView: a lazy start/stop/step window over a sequence. Slicing a view composes the
+## index arithmetic (via range slicing) without touching the data, so every helper below
+## returns a view instead of a copy when given one. Call .tolist() to materialize.
+
+
+class ListView:
+    __slots__ = ("base", "_r")
+
+    def __init__(self, base, _r=None):
+        self.base = base
+        self._r = range(len(base)) if _r is None else _r  # indices into base
+
+    def __len__(self):
+        return len(self._r)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self.base, self._r[index])  # O(1): range slicing is arithmetic
+        return self.base[self._r[index]]
+
+    def __iter__(self):
+        return map(self.base.__getitem__, self._r)
+
+    def __reversed__(self):
+        return map(self.base.__getitem__, reversed(self._r))
+
+    def tolist(self):
+        r = self._r
+        if not r:
+            return []
+        # a single C-level slice of the base; negative-step ranges end at -1, meaning "past 0"
+        return list(self.base[r.start:r.stop if r.stop >= 0 else None:r.step])
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        items = ", ".join(repr(self.base[i]) for i in self._r[:10])
+        if len(self._r) > 10:
+            items += ", ..."
+        return f"ListView([{items}], start={self._r.start}, step={self._r.step}, len={len(self)})"
 
 
 def get_element(lst, index):
@@ -45,3 +86,19 @@ if __name__ == "__main__":
     print("Step 3:", slice_with_step(sample, 3))
     print("Reverse every third:", reverse_every_third(sample))
     print("Custom slice (1:6:2):", custom_slice(sample, 1, 6, 2))
+
+    view = ListView(sample)
+    chained = get_reversed(get_every_second(exclude_edges(view)))
+    print("Chained views:", chained, "->", chained.tolist())
+
+    import time
+    big = list(range(5_000_000))
+    start = time.perf_counter()
+    copied = get_reversed(get_every_second(exclude_edges(big)))
+    t_copy = time.perf_counter() - start
+    del copied
+    start = time.perf_counter()
+    lazy = get_reversed(get_every_second(exclude_edges(ListView(big))))
+    t_view = time.perf_counter() - start
+    print(f"3 chained slices of 5M items: copies {t_copy:.3f}s, views {t_view * 1e6:.1f}us, "
+          f"lazy[0]={lazy[0]}, len={len(lazy):,}")
@@ -1,39 +1,192 @@
 
 ## Working with 2D and nested lists: access, modify, flatten, transpose, row/col extraction
+## Matrix: one contiguous typed buffer + shape/strides; transpose, rows, columns and
+## blocks are views (no copying), flatten is free for contiguous matrices, and NumPy
+## can wrap it without copying via __array__. Every helper below accepts both forms.
+
+from array import array
+
+
+class Matrix:
+    __slots__ = ("_buf", "shape", "strides", "offset")
+
+    def __init__(self, rows, cols, typecode="d", fill=0, buf=None, strides=None, offset=0):
+        self._buf = buf if buf is not None else array(typecode, [fill]) * (rows * cols)
+        self.shape = (rows, cols)
+        self.strides = strides or (cols, 1)  # in elements, not bytes
+        self.offset = offset
+
+    @classmethod
+    def from_rows(cls, rows, typecode="d"):
+        rows = list(rows)
+        cols = len(rows[0]) if rows else 0
+        if any(len(r) != cols for r in rows):
+            raise ValueError("all rows must have the same length")
+        buf = array(typecode, [x for r in rows for x in r])
+        return cls(len(rows), cols, buf=buf)
+
+    def _view(self, shape, strides, offset):
+        m = Matrix.__new__(Matrix)
+        m._buf, m.shape, m.strides, m.offset = self._buf, shape, strides, offset
+        return m
+
+    @property
+    def typecode(self):
+        return self._buf.typecode
+
+    @staticmethod
+    def _index(i, n):
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("Matrix index out of range")
+        return i
+
+    def _pos(self, i, j):
+        r, c = self.shape
+        i, j = self._index(i, r), self._index(j, c)
+        return self.offset + i * self.strides[0] + j * self.strides[1]
+
+    def __getitem__(self, key):
+        # M[i] is row i (as a 1 x cols view), like M[i, :]
+        i, j = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(i, slice) or isinstance(j, slice):
+            if not isinstance(i, slice):
+                i = self._index(i, self.shape[0])
+                i = slice(i, i + 1)
+            if not isinstance(j, slice):
+                j = self._index(j, self.shape[1])
+                j = slice(j, j + 1)
+            return self.block(i, j)
+        return self._buf[self._pos(i, j)]
+
+    def __setitem__(self, key, value):
+        i, j = key
+        self._buf[self._pos(i, j)] = value
+
+    def block(self, rows, cols):
+        r0, r1, rs = rows.indices(self.shape[0])
+        c0, c1, cs = cols.indices(self.shape[1])
+        s0, s1 = self.strides
+        return self._view((len(range(r0, r1, rs)), len(range(c0, c1, cs))),
+                          (s0 * rs, s1 * cs), self.offset + r0 * s0 + c0 * s1)
+
+    @property
+    def T(self):
+        return self._view(self.shape[::-1], self.strides[::-1], self.offset)
+
+    def row(self, i):
+        return self[i, :]
+
+    def column(self, j):
+        return self[:, j]
+
+    def is_contiguous(self):
+        return self.strides == (self.shape[1], 1) or self.shape[0] * self.shape[1] <= 1
+
+    def values(self):
+        r, c = self.shape
+        s0, s1 = self.strides
+        buf, off = self._buf, self.offset
+        for i in range(r):
+            base = off + i * s0
+            for j in range(c):
+                yield buf[base + j * s1]
+
+    def flatten(self):
+        # zero-copy memoryview for contiguous matrices; one copy otherwise
+        n = self.shape[0] * self.shape[1]
+        if self.is_contiguous():
+            return memoryview(self._buf)[self.offset:self.offset + n]
+        return memoryview(array(self.typecode, self.values()))
+
+    def copy(self):
+        return Matrix(*self.shape, buf=array(self.typecode, self.values()))
+
+    def tolist(self):
+        vals = list(self.values())
+        r, c = self.shape
+        return [vals[i * c:(i + 1) * c] for i in range(r)]
+
+    def __array__(self, dtype=None, copy=None):
+        # exported through the buffer protocol: while the NumPy view is alive it holds
+        # a memoryview, so the underlying array cannot be resized under it
+        import numpy as np
+        from numpy.lib.stride_tricks import as_strided
+        base = np.frombuffer(memoryview(self._buf), dtype=self.typecode)
+        size = base.itemsize
+        view = as_strided(base[self.offset:], shape=self.shape,
+                          strides=tuple(s * size for s in self.strides))
+        if copy or (dtype is not None and np.dtype(dtype) != view.dtype):
+            return view.astype(dtype or view.dtype)
+        return view
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and self.shape == other.shape and \
+            list(self.values()) == list(other.values())
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()})"
 
 
 def create_2d_array():
     return [[1, 2], [3, 4], [5, 6]]
 
 def access_element(matrix, row, col):
+    if isinstance(matrix, Matrix):
+        return matrix[row, col]
     return matrix[row][col]
 
 def update_element(matrix, row, col, value):
+    if isinstance(matrix, Matrix):
+        matrix[row, col] = value
+        return matrix
     matrix[row][col] = value
     return matrix
 
 def flatten_matrix(matrix):
+    if isinstance(matrix, Matrix):
+        return matrix.flatten()
     return [elem for row in matrix for elem in row]
 
 def transpose_matrix(matrix):
+    if isinstance(matrix, Matrix):
+        return matrix.T
     return [list(row) for row in zip(*matrix)]
 
 def get_row(matrix, row_index):
+    if isinstance(matrix, Matrix):
+        return matrix.row(row_index)
     return matrix[row_index]
 
 def get_column(matrix, col_index):
+    if isinstance(matrix, Matrix):
+        return matrix.column(col_index)
     return [row[col_index] for row in matrix]
 
 def add_row(matrix, new_row):
+    if isinstance(matrix, Matrix):
+        # fixed-size buffer: growing means a new Matrix
+        return Matrix.from_rows(matrix.tolist() + [list(new_row)], matrix.typecode)
     matrix.append(new_row)
     return matrix
 
 def remove_row(matrix, index):
+    if isinstance(matrix, Matrix):
+        rows = matrix.tolist()
+        if 0 <= index < len(rows):
+            rows.pop(index)
+        return Matrix.from_rows(rows, matrix.typecode)
     if 0 <= index < len(matrix):
         matrix.pop(index)
     return matrix
 
 def matrix_dimensions(matrix):
+    if isinstance(matrix, Matrix):
+        return matrix.shape
     return len(matrix), len(matrix[0]) if matrix else 0
 
 if __name__ == "__main__":
@@ -47,4 +200,20 @@ if __name__ == "__main__":
     print("Column 1:", get_column(m, 1))
     print("Add row:", add_row(m, [7, 8]))
     print("Remove row 1:", remove_row(m, 1))
-    print("Dimensions:", matrix_dimensions(m))
\ No newline at end of file
+    print("Dimensions:", matrix_dimensions(m))
+
+    mm = Matrix.from_rows(create_2d_array(), "q")
+    print("Matrix:", mm)
+    print("Transposed view:", transpose_matrix(mm))
+    print("Column 1 view:", get_column(mm, 1))
+    update_element(mm, 0, 1, 42)
+    print("After update, column view sees:", get_column(mm, 1).tolist())
+    print("Flattened (zero-copy memoryview):", flatten_matrix(mm).tolist())
+    print("Dimensions:", matrix_dimensions(mm))
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        a = np.asarray(mm.T)
+        print("NumPy view of transpose:", a.tolist(), "strides:", a.strides)
\ No newline at end of file
@@ -25,6 +25,7 @@ def filter_even(lst):
     return [x for x in lst if x % 2 == 0]
 
 def unique_elements(lst):
+    # inputs larger than RAM: external_unique in 11_external_sets.py
     return list(set(lst))
 
 def count_occurrences(lst, target):
@@ -3,6 +3,9 @@
 Real-life list use cases: score calculation, name filtering, inventory updates, matching items
 """
 
+import heapq
+from collections import Counter
+
 def average_score(scores):
     return round(sum(scores) / len(scores), 2)
 
@@ -10,24 +13,36 @@ def filter_passed(scores, threshold=60):
     return [score for score in scores if score >= threshold]
 
 def remove_duplicates(names):
+    # inputs larger than RAM: external_unique in 11_external_sets.py
     return list(dict.fromkeys(names))
 
 def match_names(list1, list2):
+    # inputs larger than RAM: external_intersection in 11_external_sets.py
     return list(set(list1) & set(list2))
 
 def get_top_n(scores, n=3):
-    return sorted(scores, reverse=True)[:n]
+    # bounded heap: O(len(scores) log n); see 10_top_k.py for streams and partitions
+    return heapq.nlargest(n, scores)
 
 def update_inventory(inventory, sold_items):
-    for item in sold_items:
-        if item in inventory:
-            inventory.remove(item)
+    # one pass over each list instead of a scan + remove per sold item;
+    # still removes the earliest occurrences, like repeated list.remove()
+    to_remove = Counter(sold_items)
+    kept = []
+    for item in inventory:
+        if to_remove[item]:
+            to_remove[item] -= 1
+        else:
+            kept.append(item)
+    inventory[:] = kept
     return inventory
 
 def calculate_total_price(prices):
     return round(sum(prices), 2)
 
 def get_items_starting_with(items, letter):
+    if hasattr(items, "starting_with"):  # SearchIndex (9_search_index.py)
+        return items.starting_with(letter)
     return [item for item in items if item.startswith(letter)]
 
 def add_new_items(inventory, new_items):
@@ -35,6 +50,8 @@ def add_new_items(inventory, new_items):
     return inventory
 
 def product_search(products, keyword):
+    if hasattr(products, "search"):  # SearchIndex (9_search_index.py)
+        return products.search(keyword)
     return [p for p in products if keyword.lower() in p.lower()]
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+"""
+6_indexed_list.py
+IndexedList: a list-like container for large mutable catalogs.
+- Values are kept in blocks of a few hundred items, so insert/pop at any position only
+  shifts one block: O(log n) to find the block (Fenwick tree over block sizes) + O(block)
+- A hash index (value -> {block: count}) answers `in` in O(1) and count() by summing the
+  few per-block counts; remove()/index() go straight to the earliest block holding the
+  value instead of probing every block (at the cost of a small dict per distinct value).
+  Blocks carry stable ids, so splitting or dropping a block only renumbers the small
+  id -> position map
+Values must be hashable. The helpers in 1_basic_operations.py work on it unchanged.
+"""
+
+from itertools import chain, islice
+
+_BLOCK = 512  # blocks are split when they grow past 2 * _BLOCK
+
+
+class IndexedList:
+    def __init__(self, items=()):
+        items = list(items)
+        self._blocks = [items[i:i + _BLOCK] for i in range(0, len(items), _BLOCK)] or [[]]
+        self._bids = list(range(len(self._blocks)))  # stable id of each block
+        self._next_bid = len(self._blocks)
+        self._where = {}  # value -> {block id: occurrences in that block}
+        for bid, block in zip(self._bids, self._blocks):
+            for v in block:
+                self._add_at(v, bid)
+        self._len = len(items)
+        self._rebuild_tree()
+
+    # -- block bookkeeping --------------------------------------------------
+
+    def _rebuild_tree(self):
+        # Fenwick tree over block lengths: prefix sums and position lookup in O(log blocks)
+        m = len(self._blocks)
+        tree = [0] * (m + 1)
+        for k, b in enumerate(self._blocks, 1):
+            tree[k] += len(b)
+            parent = k + (k & -k)
+            if parent <= m:
+                tree[parent] += tree[k]
+        self._tree = tree
+        self._pos = {bid: k for k, bid in enumerate(self._bids)}
+
+    def _add_at(self, value, bid):
+        where = self._where.get(value)
+        if where is None:
+            self._where[value] = {bid: 1}
+        else:
+            where[bid] = where.get(bid, 0) + 1
+
+    def _drop_at(self, value, bid):
+        where = self._where[value]
+        if where[bid] > 1:
+            where[bid] -= 1
+        elif len(where) > 1:
+            del where[bid]
+        else:
+            del self._where[value]
+
+    def _tree_add(self, k, delta):
+        tree = self._tree
+        k += 1
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+
+    def _offset(self, k):
+        # number of items in blocks before block k
+        total, tree = 0, self._tree
+        while k > 0:
+            total += tree[k]
+            k -= k & -k
+        return total
+
+    def _locate(self, i):
+        # (block, index within block) for position 0 <= i < len
+        tree = self._tree
+        k, step = 0, 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = k + step
+            if nxt < len(tree) and tree[nxt] <= i:
+                k = nxt
+                i -= tree[nxt]
+            step >>= 1
+        return k, i
+
+    def _norm(self, i, for_insert=False):
+        n = self._len
+        if i < 0:
+            i += n
+        if for_insert:
+            return min(max(i, 0), n)
+        if not 0 <= i < n:
+            raise IndexError("IndexedList index out of range")
+        return i
+
+    def _after_shrink(self, k):
+        if not self._blocks[k] and len(self._blocks) > 1:
+            del self._blocks[k]
+            del self._bids[k]
+            self._rebuild_tree()
+
+    def _take(self, k, j):
+        block = self._blocks[k]
+        value = block.pop(j)
+        self._drop_at(value, self._bids[k])
+        self._len -= 1
+        self._tree_add(k, -1)
+        self._after_shrink(k)
+        return value
+
+    # -- list API -----------------------------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        return value in self._where
+
+    def count(self, value):
+        return sum(self._where.get(value, {}).values())
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._slice(i)
+        k, j = self._locate(self._norm(i))
+        return self._blocks[k][j]
+
+    def _slice(self, sl):
+        # only the blocks overlapping the slice are walked, from the first one on
+        start, stop, step = sl.indices(self._len)
+        lo, hi = (start, stop) if step > 0 else (stop + 1, start + 1)
+        if lo >= hi:
+            return []
+        k, j = self._locate(lo)
+        items = chain(islice(self._blocks[k], j, None),
+                      chain.from_iterable(islice(self._blocks, k + 1, None)))
+        seg = list(islice(items, hi - lo))
+        return seg[::step] if step != 1 else seg
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            raise TypeError("IndexedList does not support slice assignment")
+        k, j = self._locate(self._norm(i))
+        block = self._blocks[k]
+        old = block[j]
+        block[j] = value
+        self._drop_at(old, self._bids[k])
+        self._add_at(value, self._bids[k])
+
+    def insert(self, i, value):
+        i = self._norm(i, for_insert=True)
+        if i == self._len:
+            k, j = len(self._blocks) - 1, len(self._blocks[-1])
+        else:
+            k, j = self._locate(i)
+        block = self._blocks[k]
+        block.insert(j, value)
+        bid = self._bids[k]
+        self._add_at(value, bid)
+        self._len += 1
+        if len(block) > 2 * _BLOCK:
+            half = len(block) // 2
+            tail, new = block[half:], self._next_bid
+            self._next_bid += 1
+            for v in tail:
+                self._drop_at(v, bid)
+                self._add_at(v, new)
+            self._blocks[k:k + 1] = [block[:half], tail]
+            self._bids.insert(k + 1, new)
+            self._rebuild_tree()
+        else:
+            self._tree_add(k, 1)
+
+    def append(self, value):
+        self.insert(self._len, value)
+
+    def extend(self, values):
+        for v in values:
+            self.append(v)
+
+    def pop(self, i=-1):
+        if not self._len:
+            raise IndexError("pop from empty IndexedList")
+        k, j = self._locate(self._norm(i))
+        return self._take(k, j)
+
+    def _first(self, value):
+        # first (block, index) holding value: the earliest of the blocks that hold it
+        where = self._where.get(value)
+        if where is None:
+            raise ValueError(f"{value!r} is not in IndexedList")
+        pos = self._pos
+        k = min(pos[bid] for bid in where)
+        return k, self._blocks[k].index(value)
+
+    def remove(self, value):
+        self._take(*self._first(value))
+
+    def index(self, value):
+        k, j = self._first(value)
+        return self._offset(k) + j
+
+    def clear(self):
+        self.__init__()
+
+    def copy(self):
+        return IndexedList(self)
+
+    def reverse(self):
+        self.__init__(reversed(list(self)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"IndexedList({list(self)!r})"
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+    from _support import load_sibling
+
+    ops = load_sibling(__file__, "1_basic_operations.py")
+
+    lst = IndexedList([1, 2, 3, 4])
+    print("Original:", lst)
+    print("Appended:", ops.append_element(lst, 5))
+    print("Inserted:", ops.insert_element(lst, 2, 99))
+    print("Removed:", ops.remove_element(lst, 3))
+    print("Updated:", ops.update_element(lst, 1, 100))
+    print("Searched 4:", ops.search_element(lst, 4))
+    print("Reversed:", ops.reverse_list(lst))
+
+    n, q = 200_000, 2_000
+    rng = random.Random(0)
+    data = list(range(n))
+    for label, container in (("list", list(data)), ("IndexedList", IndexedList(data))):
+        start = time.perf_counter()
+        for _ in range(q):
+            container.insert(rng.randrange(len(container)), -1)
+            _ = rng.randrange(n) in container
+            container.pop(rng.randrange(len(container)))
+        print(f"{label:<12} {q:,} insert+contains+pop rounds on {n:,} items: "
+              f"{time.perf_counter() - start:.2f}s")
@@ -0,0 +1,119 @@
+"""
+7_inventory.py
+Inventory: counted multiset of SKUs for large catalogs (replaces list-based inventories).
+- add_items / remove_items take any iterable of SKUs (or a {sku: qty} mapping) and run in
+  time linear in the batch, independent of the catalog size
+- remove_items is atomic: with strict=True nothing changes unless every unit is available
+- SKUs are reported in first-stocked order (dicts keep insertion order)
+- to_bytes / from_bytes give a compact snapshot (zlib-compressed JSON pairs)
+"""
+
+import json
+import zlib
+from collections import Counter
+
+
+def _as_counts(items):
+    if not isinstance(items, dict):
+        return Counter(items)
+    if any(qty < 0 for qty in items.values()):
+        raise ValueError("quantities must be non-negative")
+    return Counter({sku: qty for sku, qty in items.items() if qty})
+
+
+class Inventory:
+    def __init__(self, items=()):
+        self._stock = {}
+        self.add_items(items)
+
+    def __len__(self):
+        # total units in stock
+        return sum(self._stock.values())
+
+    def __contains__(self, sku):
+        return sku in self._stock
+
+    def __getitem__(self, sku):
+        return self._stock.get(sku, 0)
+
+    def skus(self):
+        return list(self._stock)
+
+    def items(self):
+        return list(self._stock.items())
+
+    def to_list(self):
+        # expand back to the original one-entry-per-unit list representation
+        return [sku for sku, qty in self._stock.items() for _ in range(qty)]
+
+    def add_items(self, items):
+        stock = self._stock
+        for sku, qty in _as_counts(items).items():
+            stock[sku] = stock.get(sku, 0) + qty
+
+    def remove_items(self, items, strict=False):
+        """Remove a batch; returns {sku: units not removed}. With strict=True a batch
+        that cannot be fully satisfied raises ValueError and leaves stock untouched."""
+        counts = _as_counts(items)
+        stock = self._stock
+        missing = {sku: qty - stock.get(sku, 0) for sku, qty in counts.items()
+                   if qty > stock.get(sku, 0)}
+        if strict and missing:
+            raise ValueError(f"insufficient stock: {missing}")
+        for sku, qty in counts.items():
+            left = stock.get(sku, 0) - qty
+            if left > 0:
+                stock[sku] = left
+            else:
+                stock.pop(sku, None)
+        return missing
+
+    def to_bytes(self):
+        pairs = list(self._stock.items())
+        return zlib.compress(json.dumps(pairs, separators=(",", ":")).encode())
+
+    @classmethod
+    def from_bytes(cls, data):
+        inv = cls()
+        inv._stock = {sku: qty for sku, qty in json.loads(zlib.decompress(data))}
+        return inv
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __eq__(self, other):
+        return isinstance(other, Inventory) and self._stock == other._stock
+
+    def __repr__(self):
+        return f"Inventory({self._stock!r})"
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    inv = Inventory(["apple", "banana", "carrot", "banana"])
+    print("Inventory:", inv)
+    print("Not removed:", inv.remove_items(["banana", "kiwi"]))
+    print("After sale:", inv, "as list:", inv.to_list())
+    try:
+        inv.remove_items({"apple": 5}, strict=True)
+    except ValueError as e:
+        print("Rejected batch:", e, "->", inv)
+
+    skus = [f"SKU{i:06d}" for i in range(500_000)]
+    rng = random.Random(0)
+    sold = [rng.choice(skus) for _ in range(50_000)]
+    start = time.perf_counter()
+    big = Inventory(skus)
+    big.remove_items(sold)
+    elapsed = time.perf_counter() - start
+    blob = big.to_bytes()
+    print(f"500k SKUs, 50k sold: {elapsed:.2f}s, {len(big):,} units left, "
+          f"snapshot {len(blob) / 1024:.0f} KiB, round-trip ok: {Inventory.from_bytes(blob) == big}")
@@ -0,0 +1,182 @@
+"""
+8_streaming_stats.py
+StreamStats: one-pass, mergeable replacement for calculate_sum, calculate_average,
+find_min, find_max and count_occurrences (4_array_algorithms.py), plus variance and
+histogram buckets.
+- update / update_many consume any iterator; update_many works chunk by chunk so the
+  heavy lifting (sum, min, max, count) runs in C
+- merge() combines partial results exactly (Chan et al. parallel variance), so chunks
+  can be processed in worker processes and folded together
+- stats_from_file() splits a text file of numbers into byte ranges, one per worker
+"""
+
+import math
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+class StreamStats:
+    __slots__ = ("count", "total", "_mean", "_m2", "min", "max", "edges", "buckets", "occurrences")
+
+    def __init__(self, edges=(), track=()):
+        # edges: sorted bucket boundaries -> len(edges) + 1 buckets (bucket i holds
+        # edges[i-1] <= x < edges[i]); track: values whose occurrences are counted
+        self.count = 0
+        self.total = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared deviations from the mean
+        self.min = None
+        self.max = None
+        self.edges = list(edges)
+        self.buckets = [0] * (len(self.edges) + 1) if self.edges else []
+        self.occurrences = dict.fromkeys(track, 0)
+
+    def update(self, x):
+        self.count += 1
+        self.total += x
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)  # Welford
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        if self.edges:
+            self.buckets[bisect_right(self.edges, x)] += 1
+        if x in self.occurrences:
+            self.occurrences[x] += 1
+
+    def update_many(self, values, chunk_size=65536):
+        it = iter(values)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return self
+            self.merge(self._from_chunk(chunk))
+
+    def _from_chunk(self, chunk):
+        part = StreamStats(self.edges, self.occurrences)
+        n = len(chunk)
+        part.count = n
+        part.total = sum(chunk)
+        part._mean = part.total / n
+        part._m2 = math.fsum((x - part._mean) ** 2 for x in chunk)
+        part.min, part.max = min(chunk), max(chunk)
+        if self.edges:
+            edges, buckets = self.edges, part.buckets
+            for x in chunk:
+                buckets[bisect_right(edges, x)] += 1
+        for target in part.occurrences:
+            part.occurrences[target] = chunk.count(target)
+        return part
+
+    def merge(self, other):
+        if other.edges != self.edges:
+            raise ValueError("cannot merge stats with different histogram edges")
+        if not other.count:
+            return self
+        n1, n2 = self.count, other.count
+        n = n1 + n2
+        delta = other._mean - self._mean
+        self._mean += delta * n2 / n
+        self._m2 += other._m2 + delta * delta * n1 * n2 / n
+        self.count = n
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        for target, c in other.occurrences.items():
+            self.occurrences[target] = self.occurrences.get(target, 0) + c
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0  # same as calculate_average
+
+    @property
+    def variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def count_of(self, target):
+        return self.occurrences[target]
+
+    def __repr__(self):
+        return (f"StreamStats(count={self.count}, sum={self.total}, mean={self.mean:.6g}, "
+                f"min={self.min}, max={self.max}, var={self.variance:.6g})")
+
+
+def _numbers_in_range(path, start, end):
+    # yields numbers from lines whose first byte lies in [start, end)
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # finish the line that straddles `start`; its owner is the previous range
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            for tok in line.split():
+                yield float(tok)
+
+
+def _stats_for_range(path, start, end, edges, track):
+    return StreamStats(edges, track).update_many(_numbers_in_range(path, start, end))
+
+
+def stats_from_file(path, processes=None, edges=(), track=()):
+    """Whitespace-separated numbers in a text file; processes=0 reads it in-process."""
+    size = os.path.getsize(path)
+    workers = processes if processes is not None else (os.cpu_count() or 1)
+    if workers <= 1 or size < 1 << 20:
+        return _stats_for_range(path, 0, size, list(edges), list(track))
+    step = -(-size // workers)
+    ranges = [(s, min(size, s + step)) for s in range(0, size, step)]
+    result = StreamStats(edges, track)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_stats_for_range, path, s, e, list(edges), list(track))
+                   for s, e in ranges]
+        for fut in futures:
+            result.merge(fut.result())
+    return result
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    data = [4, 2, 7, 2, 9, 4, 6, 8]
+    st = StreamStats(edges=[3, 6], track=[4]).update_many(iter(data))
+    print(st)
+    print("Sum:", st.total, "Average:", st.mean, "Min:", st.min, "Max:", st.max)
+    print("Occurrences of 4:", st.count_of(4), "Buckets (<3, 3-6, >=6):", st.buckets)
+
+    left = StreamStats().update_many(data[:3])
+    right = StreamStats().update_many(data[3:])
+    print("Merged halves match:", abs(left.merge(right).variance - st.variance) < 1e-12)
+
+    rng = random.Random(0)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for _ in range(2_000_000):
+            f.write(f"{rng.gauss(100, 15):.4f}\n")
+        path = f.name
+    try:
+        for procs in (0, 4):
+            start = time.perf_counter()
+            res = stats_from_file(path, processes=procs, edges=[70, 100, 130])
+            print(f"file, processes={procs}: {time.perf_counter() - start:.2f}s -> {res}, "
+                  f"buckets={res.buckets}")
+    finally:
+        os.remove(path)
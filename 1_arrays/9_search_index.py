@@ -0,0 +1,212 @@
+"""
+9_search_index.py
+SearchIndex: a prebuilt index over a product catalog for the two lookups in
+5_array_use_cases.py, without scanning the catalog per query.
+- starting_with(prefix): sorted array of (product, id) pairs; bisect to the first match
+  and walk forward while it still matches (case-sensitive, like str.startswith)
+- search(keyword): case-insensitive substring search through a trigram inverted index;
+  the posting sets of the keyword's trigrams are intersected (smallest first) and the
+  few survivors are verified against the pre-lowered product text. A keyword shorter
+  than a trigram is the union of the postings of the trigrams that contain it (a small
+  map from each shorter substring to those trigrams), plus products too short to have
+  a trigram
+- add / remove update the index incrementally; results come back in catalog order.
+  Removed products leave empty slots until they outnumber the live ones, then the
+  index is rebuilt from the live products
+- hot queries are answered from a small LRU cache that is cleared on every change
+"""
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+
+class SearchIndex:
+    def __init__(self, products=(), gram=3, cache_size=1024):
+        self.gram = gram
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._build(products)
+
+    def _build(self, products):
+        self._items = []     # id -> product, None once removed
+        self._lower = []     # id -> product.lower(), None once removed
+        self._ids = {}       # product -> ids still present, ascending
+        self._sorted = []    # (product, id), sorted
+        self._postings = {}  # gram -> set of ids
+        self._within = {}    # shorter substring -> grams (posting keys) that contain it
+        self._short = set()  # ids of products shorter than a gram
+        self._len = 0
+        for p in products:
+            self._insert(p)
+        self._sorted.sort()
+
+    def _grams(self, text, g=None):
+        g = g or self.gram
+        return {text[i:i + g] for i in range(len(text) - g + 1)}
+
+    def _subgrams(self, gram):
+        return set().union(*(self._grams(gram, g) for g in range(1, self.gram)))
+
+    def _insert(self, product):
+        # appends to _sorted unsorted; callers keep it sorted
+        pid = len(self._items)
+        low = product.lower()
+        self._items.append(product)
+        self._lower.append(low)
+        self._ids.setdefault(product, []).append(pid)
+        self._sorted.append((product, pid))
+        if len(low) < self.gram:
+            self._short.add(pid)
+        postings = self._postings
+        for g in self._grams(low):
+            s = postings.get(g)
+            if s is None:
+                postings[g] = {pid}
+                for sub in self._subgrams(g):
+                    self._within.setdefault(sub, set()).add(g)
+            else:
+                s.add(pid)
+        self._len += 1
+
+    def add(self, product):
+        self._insert(product)
+        entry = self._sorted.pop()
+        insort(self._sorted, entry)
+        self._cache.clear()
+
+    def extend(self, products):
+        for p in products:
+            self._insert(p)
+        self._sorted.sort()
+        self._cache.clear()
+
+    def remove(self, product):
+        # removes the earliest occurrence, like list.remove
+        ids = self._ids.get(product)
+        if not ids:
+            raise ValueError(f"{product!r} is not in SearchIndex")
+        pid = ids.pop(0)
+        if not ids:
+            del self._ids[product]
+        i = bisect_left(self._sorted, (product, pid))
+        del self._sorted[i]
+        for g in self._grams(self._lower[pid]):
+            s = self._postings[g]
+            s.discard(pid)
+            if not s:
+                del self._postings[g]
+                for sub in self._subgrams(g):
+                    within = self._within[sub]
+                    within.discard(g)
+                    if not within:
+                        del self._within[sub]
+        self._short.discard(pid)
+        self._items[pid] = self._lower[pid] = None
+        self._len -= 1
+        if len(self._items) > 2 * self._len + 64:
+            # mostly empty slots: renumber the live products so ids stay dense
+            self._build([p for p in self._items if p is not None])
+        self._cache.clear()
+
+    def _cached(self, key, compute):
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            return list(cache[key])
+        result = compute()
+        cache[key] = result
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return list(result)
+
+    def starting_with(self, prefix):
+        return self._cached(("prefix", prefix), lambda: self._starting_with(prefix))
+
+    def _starting_with(self, prefix):
+        srt = self._sorted
+        i = bisect_left(srt, (prefix,))
+        ids = []
+        while i < len(srt) and srt[i][0].startswith(prefix):
+            ids.append(srt[i][1])
+            i += 1
+        ids.sort()
+        return [self._items[pid] for pid in ids]
+
+    def search(self, keyword):
+        kw = keyword.lower()
+        return self._cached(("search", kw), lambda: self._search(kw))
+
+    def _search(self, kw):
+        items, lower = self._items, self._lower
+        if not kw:
+            return list(self)
+        if len(kw) < self.gram:
+            # every occurrence of kw lies inside some gram of the product, unless the
+            # product has no gram at all
+            postings = self._postings
+            ids = set().union(*(postings[g] for g in self._within.get(kw, ())))
+            ids.update(pid for pid in self._short if kw in lower[pid])
+            return [items[pid] for pid in sorted(ids)]
+        sets = []
+        for g in self._grams(kw):
+            s = self._postings.get(g)
+            if not s:
+                return []
+            sets.append(s)
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:])
+        return [items[pid] for pid in sorted(candidates) if kw in lower[pid]]
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, product):
+        return product in self._ids
+
+    def __iter__(self):
+        return (p for p in self._items if p is not None)
+
+    def __repr__(self):
+        return f"SearchIndex({self._len} products, {len(self._postings)} grams)"
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+    from _support import load_sibling
+
+    uses = load_sibling(__file__, "5_array_use_cases.py")
+
+    idx = SearchIndex(["Milk", "Dark Chocolate", "Almond Milk", "apple", "avocado"])
+    print("Search products:", uses.product_search(idx, "milk"))
+    print("Starts with 'a':", uses.get_items_starting_with(idx, "a"))
+    idx.add("Oat Milk")
+    idx.remove("Milk")
+    print("After add/remove:", idx.search("MILK"))
+
+    rng = random.Random(0)
+    words = ["milk", "dark", "chocolate", "almond", "oat", "organic", "bread", "butter",
+             "cheese", "green", "tea", "coffee", "roast", "honey", "rice", "pasta"]
+    n = 300_000
+    catalog = [" ".join(rng.choice(words).title() for _ in range(3)) + f" {i}" for i in range(n)]
+    t0 = time.perf_counter()
+    idx = SearchIndex(catalog)
+    print(f"indexed {n:,} products in {time.perf_counter() - t0:.2f}s: {idx}")
+    queries = [f"{rng.choice(words)} {rng.choice(words)} {rng.randrange(n)}" for _ in range(200)]
+    prefixes = [catalog[rng.randrange(n)][:12] for _ in range(200)]
+    for label, fn, data in (
+        ("product_search list", uses.product_search, catalog),
+        ("product_search index", uses.product_search, idx),
+        ("starting_with list", uses.get_items_starting_with, catalog),
+        ("starting_with index", uses.get_items_starting_with, idx),
+    ):
+        qs = queries if "search" in label else prefixes
+        t0 = time.perf_counter()
+        results = [fn(data, q) for q in qs]
+        dt = time.perf_counter() - t0
+        print(f"{label:<22} {len(qs)} queries: {dt * 1e3 / len(qs):8.3f} ms/query "
+              f"({sum(map(len, results))} hits)")
@@ -1,35 +1,89 @@
 """
-Stack implemented using two queues (amortized O(1) for push, O(n) for pop-or-push depending on strategy).
+Stack implemented using queues only (enqueue at the back, dequeue from the front).
 Educational: demonstrates duality between stacks and queues.
+Strategies:
+- "rotate" (default): two queues; push moves the whole queue behind the new item, so
+  pop is O(1) but push is O(n)
+- "nested": the queue holds [top, rest], where rest is the queue that was the stack
+  before the push; push and pop are O(1) and still only enqueue/dequeue. Every item
+  costs a whole deque object (~800 bytes on 64-bit CPython, against ~40 for "rotate"),
+  and the chain is unwound iteratively on clear()/deletion, since letting CPython free
+  it recursively overflows the C stack for a few hundred thousand items.
 """
 from __future__ import annotations
 from collections import deque
 
 class StackViaQueues:
-    def __init__(self):
-        self.q1, self.q2 = deque(), deque()
+    def __init__(self, strategy: str = "rotate"):
+        if strategy not in ("nested", "rotate"):
+            raise ValueError(f"unknown strategy {strategy!r}")
+        self.strategy = strategy
+        self.q1 = deque()
+        self.q2 = deque() if strategy == "rotate" else None  # spare queue for rotating
+        self._size = 0
 
     def push(self, x):
-        # Strategy A: cost on push so that pop is O(1)
-        self.q2.append(x)
-        while self.q1:
-            self.q2.append(self.q1.popleft())
-        self.q1, self.q2 = self.q2, self.q1
+        if self.strategy == "nested":
+            # new queue: the item, then the previous stack as a single element
+            q = deque()
+            q.append(x)
+            q.append(self.q1)
+            self.q1 = q
+        else:
+            # Strategy A: cost on push so that pop is O(1)
+            self.q2.append(x)
+            while self.q1:
+                self.q2.append(self.q1.popleft())
+            self.q1, self.q2 = self.q2, self.q1
+        self._size += 1
 
     def pop(self):
-        if not self.q1: raise IndexError("empty")
-        return self.q1.popleft()
+        if not self._size: raise IndexError("empty")
+        x = self.q1.popleft()
+        if self.strategy == "nested":
+            self.q1 = self.q1.popleft()  # the stack below x
+        self._size -= 1
+        return x
+
+    def clear(self):
+        if self.strategy == "nested":
+            # detach one level at a time so no deque is freed while holding the rest
+            q = self.q1
+            while q:
+                q.popleft()
+                q = q.popleft()
+        self.q1 = deque()
+        self._size = 0
+
+    def __del__(self):
+        if getattr(self, "strategy", None) == "nested":
+            self.clear()
 
     def peek(self):
-        if not self.q1: raise IndexError("empty")
+        if not self._size: raise IndexError("empty")
         return self.q1[0]
 
+    def __len__(self):
+        return self._size
+
 def _demo():
-    s = StackViaQueues()
-    for i in range(5):
-        s.push(i)
-    print("peek:", s.peek())
-    print("pop sequence:", [s.pop() for _ in range(5)])
+    for strategy in ("nested", "rotate"):
+        s = StackViaQueues(strategy)
+        for i in range(5):
+            s.push(i)
+        print(f"{strategy}: peek:", s.peek())
+        print(f"{strategy}: pop sequence:", [s.pop() for _ in range(5)])
+
+    import time
+    n = 5_000
+    for strategy in ("nested", "rotate"):
+        s = StackViaQueues(strategy)
+        t0 = time.perf_counter()
+        for i in range(n):
+            s.push(i)
+        while len(s):
+            s.pop()
+        print(f"{strategy}: {n:,} pushes + pops in {time.perf_counter() - t0:.3f}s")
 
 if __name__ == "__main__":
     _demo()
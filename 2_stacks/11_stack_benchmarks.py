@@ -0,0 +1,237 @@
+"""
+Benchmark harness for every stack implementation in this folder.
+- Workloads: push-heavy, pop-heavy, mixed (push, push, pop), peek-heavy
+- Reports ops/sec, per-op latency percentiles (p50/p90/p99 over timed batches)
+  and peak traced memory (separate tracemalloc pass so it does not skew timings)
+- Writes machine-readable JSON and compares against a saved baseline to flag regressions
+
+Usage:
+    python 2_stacks/11_stack_benchmarks.py                          # print table
+    python 2_stacks/11_stack_benchmarks.py --json out.json          # also save results
+    python 2_stacks/11_stack_benchmarks.py --baseline out.json      # exit 1 on regression
+"""
+from __future__ import annotations
+import argparse, gc, json, platform, sys, time, tracemalloc
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import load_sibling
+
+@dataclass
+class StackAdapter:
+    """Uniform push/pop/peek view over stacks whose APIs differ slightly."""
+    push: Callable
+    pop: Callable
+    peek: Optional[Callable]
+
+def _implementations() -> Dict[str, Callable[[int], StackAdapter]]:
+    basic = load_sibling(__file__, "1_array_and_linked_list_stack.py")
+    minmax = load_sibling(__file__, "2_min_max_stack.py")
+    threadsafe = load_sibling(__file__, "8_threadsafe_stack.py")
+    bounded = load_sibling(__file__, "9_capacity_bounded_stack.py")
+    via_queues = load_sibling(__file__, "10_stack_via_two_queues.py")
+
+    def adapt(stack, peek_name: Optional[str] = "peek") -> StackAdapter:
+        peek = getattr(stack, peek_name) if peek_name else None
+        return StackAdapter(stack.push, stack.pop, peek)
+
+    return {
+        "ArrayStack": lambda n: adapt(basic.ArrayStack()),
+        "ArrayStack[q]": lambda n: adapt(basic.ArrayStack(typecode="q")),
+        "LinkedListStack": lambda n: adapt(basic.LinkedListStack()),
+        "MinMaxStack": lambda n: adapt(minmax.MinMaxStack(), "top"),
+        "BoundedStack": lambda n: adapt(bounded.BoundedStack(max(n, 1))),
+        "ThreadSafeStack": lambda n: adapt(threadsafe.ThreadSafeStack(), None),
+        "StripedStack": lambda n: adapt(threadsafe.StripedThreadSafeStack(), None),
+        "StackViaQueues": lambda n: adapt(via_queues.StackViaQueues()),
+        "StackViaQueues[nested]": lambda n: adapt(via_queues.StackViaQueues("nested")),
+    }
+
+# Each workload is (prefill(stack, n), run(stack, lo, hi)); run performs ops [lo, hi).
+def _no_prefill(s: StackAdapter, n: int) -> None:
+    pass
+
+def _prefill_n(s: StackAdapter, n: int) -> None:
+    push = s.push
+    for i in range(n):
+        push(i)
+
+def _prefill_half(s: StackAdapter, n: int) -> None:
+    _prefill_n(s, n // 2)
+
+def _prefill_small(s: StackAdapter, n: int) -> None:
+    _prefill_n(s, min(n, 1_000) or 1)
+
+def _run_push(s: StackAdapter, lo: int, hi: int) -> None:
+    push = s.push
+    for i in range(lo, hi):
+        push(i)
+
+def _run_pop(s: StackAdapter, lo: int, hi: int) -> None:
+    pop = s.pop
+    for _ in range(lo, hi):
+        pop()
+
+def _run_mixed(s: StackAdapter, lo: int, hi: int) -> None:
+    # push, push, pop: net growth so the stack never runs dry
+    push, pop = s.push, s.pop
+    for i in range(lo, hi):
+        if i % 3 == 2:
+            pop()
+        else:
+            push(i)
+
+def _run_peek(s: StackAdapter, lo: int, hi: int) -> None:
+    # 9 peeks : 1 push/pop pair, roughly what a parser lookahead does
+    push, pop, peek = s.push, s.pop, s.peek
+    for i in range(lo, hi):
+        if i % 10 == 9:
+            push(pop())
+        else:
+            peek()
+
+WORKLOADS = {
+    "push_heavy": (_no_prefill, _run_push),
+    "pop_heavy": (_prefill_n, _run_pop),
+    "mixed": (_prefill_half, _run_mixed),
+    "peek_heavy": (_prefill_small, _run_peek),
+}
+
+@dataclass
+class Result:
+    impl: str
+    workload: str
+    size: int
+    repeats: int
+    ops_per_sec: float
+    best_sec: float
+    p50_ns: float
+    p90_ns: float
+    p99_ns: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.impl}/{self.workload}/{self.size}"
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, max(0, round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+def bench_one(factory: Callable[[int], StackAdapter], workload: str, n: int,
+              repeats: int = 5, batch: int = 1_000) -> Optional[tuple]:
+    prefill, run = WORKLOADS[workload]
+    if workload == "peek_heavy" and factory(1).peek is None:
+        return None  # implementation has no peek
+    totals: List[float] = []
+    per_op_ns: List[float] = []
+    clock = time.perf_counter
+    for _ in range(repeats):
+        s = factory(n)
+        prefill(s, n)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()  # keep collector pauses out of the measured region
+        try:
+            total = 0.0
+            for lo in range(0, n, batch):
+                hi = min(n, lo + batch)
+                t0 = clock()
+                run(s, lo, hi)
+                dt = clock() - t0
+                total += dt
+                per_op_ns.append(dt / (hi - lo) * 1e9)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        totals.append(total)
+
+    # peak memory in its own pass: tracemalloc adds per-allocation overhead
+    tracemalloc.start()
+    try:
+        s = factory(n)
+        prefill(s, n)
+        run(s, 0, n)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    per_op_ns.sort()
+    best = min(totals)
+    return best, len(totals), _percentile(per_op_ns, 0.50), _percentile(per_op_ns, 0.90), \
+        _percentile(per_op_ns, 0.99), peak
+
+def run_suite(impls: List[str], workloads: List[str], sizes: List[int],
+              repeats: int, batch: int, verbose: bool = True) -> List[Result]:
+    registry = _implementations()
+    results: List[Result] = []
+    for name in impls:
+        for wl in workloads:
+            for n in sizes:
+                r = bench_one(registry[name], wl, n, repeats, batch)
+                if r is None:
+                    continue
+                best, reps, p50, p90, p99, peak = r
+                res = Result(name, wl, n, reps, n / best if best else float("inf"),
+                             best, p50, p90, p99, peak)
+                results.append(res)
+                if verbose:
+                    print(f"{name:<22} {wl:<11} n={n:<9,} {res.ops_per_sec:>14,.0f} ops/s  "
+                          f"p50={p50:7.1f}ns p90={p90:7.1f}ns p99={p99:7.1f}ns  "
+                          f"peak={peak / 1024:10,.1f} KiB", flush=True)
+    return results
+
+def compare(results: List[Result], baseline: dict, threshold: float) -> List[str]:
+    base = {f"{r['impl']}/{r['workload']}/{r['size']}": r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = base.get(r.key)
+        if not b:
+            continue
+        ratio = r.ops_per_sec / b["ops_per_sec"] if b["ops_per_sec"] else float("inf")
+        if ratio < 1 - threshold:
+            regressions.append(f"{r.key}: {r.ops_per_sec:,.0f} ops/s vs baseline "
+                               f"{b['ops_per_sec']:,.0f} ({(ratio - 1) * 100:+.1f}%)")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    impl_names = list(_implementations())
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--impl", nargs="+", default=impl_names, choices=impl_names)
+    p.add_argument("--workload", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    p.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000],
+                   help="StackViaQueues push is O(n); keep sizes modest when it is included")
+    p.add_argument("--repeats", type=int, default=5)
+    p.add_argument("--batch", type=int, default=1_000, help="ops per latency sample")
+    p.add_argument("--json", dest="json_out", help="write results to this JSON file")
+    p.add_argument("--baseline", help="JSON file from a previous --json run")
+    p.add_argument("--threshold", type=float, default=0.10,
+                   help="fractional ops/sec drop that counts as a regression")
+    args = p.parse_args(argv)
+
+    results = run_suite(args.impl, args.workload, args.sizes, args.repeats, args.batch)
+    if args.json_out:
+        payload = {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "results": [asdict(r) for r in results],
+        }
+        Path(args.json_out).write_text(json.dumps(payload, indent=2))
+        print(f"wrote {len(results)} results to {args.json_out}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} vs {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+asyncio-native LIFO stack with optional capacity and backpressure.
+- `await push(x)` waits while the stack is full; `await pop()` waits while it is empty
+- push_nowait / pop_nowait never wait (OverflowError / IndexError, like the other stacks)
+- `await pop_many(n)` takes up to n items (top first) once at least one is available
+- timeouts are measured on the event loop clock and raise TimeoutError
+Waiters park on plain futures, so thousands of coroutines share one stack without threads.
+"""
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import Deque, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+class AsyncStack(Generic[T]):
+    def __init__(self, capacity: int = 0):
+        # capacity <= 0 means unbounded
+        self.capacity = capacity
+        self._data: list[T] = []
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def empty(self) -> bool:
+        return not self._data
+
+    def full(self) -> bool:
+        return 0 < self.capacity <= len(self._data)
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future], n: int = 1) -> None:
+        while n and waiters:
+            w = waiters.popleft()
+            if not w.done():
+                w.set_result(None)
+                n -= 1
+
+    async def _park(self, waiters: Deque[asyncio.Future], timeout: Optional[float],
+                    deadline: Optional[float], ready) -> Optional[float]:
+        loop = asyncio.get_running_loop()
+        if timeout is not None and deadline is None:
+            deadline = loop.time() + timeout
+        fut = loop.create_future()
+        waiters.append(fut)
+        try:
+            if deadline is None:
+                await fut
+            else:
+                await asyncio.wait_for(fut, max(0.0, deadline - loop.time()))
+        except BaseException:
+            fut.cancel()
+            try:
+                waiters.remove(fut)
+            except ValueError:
+                pass
+            # we were woken but are leaving anyway: pass the wake-up on
+            if ready() and not fut.cancelled():
+                self._wakeup_next(waiters)
+            raise
+        return deadline
+
+    def push_nowait(self, item: T) -> None:
+        if self.full():
+            raise OverflowError("stack full")
+        self._data.append(item)
+        self._wakeup_next(self._getters)
+
+    async def push(self, item: T, timeout: Optional[float] = None) -> None:
+        deadline = None
+        while self.full():
+            deadline = await self._park(self._putters, timeout, deadline, lambda: not self.full())
+        self.push_nowait(item)
+
+    async def push_many(self, items: Iterable[T], timeout: Optional[float] = None) -> None:
+        # pushes in order, waiting for room as needed; timeout covers the whole batch
+        deadline = None
+        for item in items:
+            while self.full():
+                deadline = await self._park(self._putters, timeout, deadline, lambda: not self.full())
+            self.push_nowait(item)
+
+    def pop_nowait(self) -> T:
+        if not self._data:
+            raise IndexError("pop from empty AsyncStack")
+        item = self._data.pop()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def pop(self, timeout: Optional[float] = None) -> T:
+        deadline = None
+        while not self._data:
+            deadline = await self._park(self._getters, timeout, deadline, lambda: bool(self._data))
+        return self.pop_nowait()
+
+    async def pop_many(self, max_n: int, timeout: Optional[float] = None) -> list[T]:
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        deadline = None
+        while not self._data:
+            deadline = await self._park(self._getters, timeout, deadline, lambda: bool(self._data))
+        cut = max(0, len(self._data) - max_n)
+        batch = self._data[cut:]
+        del self._data[cut:]
+        batch.reverse()
+        self._wakeup_next(self._putters, len(batch))
+        return batch
+
+async def _demo_async():
+    stk = AsyncStack[int](capacity=16)
+    producers, items_each = 500, 20
+    got: list[int] = []
+
+    async def producer(p: int):
+        for i in range(items_each):
+            await stk.push(p * items_each + i)  # waits whenever 16 items are pending
+
+    async def consumer():
+        while len(got) < producers * items_each:
+            try:
+                got.extend(await stk.pop_many(8, timeout=0.5))
+            except TimeoutError:
+                return
+
+    await asyncio.gather(*(producer(p) for p in range(producers)),
+                         *(consumer() for _ in range(100)))
+    print(f"{producers} producers / 100 consumers moved {len(got)} items, "
+          f"all unique: {len(set(got)) == len(got)}, left: {len(stk)}")
+
+    try:
+        await stk.pop(timeout=0.05)
+    except TimeoutError:
+        print("pop on empty stack timed out as expected")
+    for x in (1, 2, 3):
+        stk.push_nowait(x)
+    print("LIFO:", [stk.pop_nowait() for _ in range(3)])
+
+def _demo():
+    asyncio.run(_demo_async())
+
+if __name__ == "__main__":
+    _demo()
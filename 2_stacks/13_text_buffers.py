@@ -0,0 +1,373 @@
+"""
+Text buffers for editors, built to back the UndoRedo manager from 5_undo_redo_manager.py.
+- GapBuffer: two stacks of characters meeting at the cursor (the "gap"). Edits at the
+  cursor are O(1) amortized; moving the cursor by d costs O(d). Newline positions are
+  kept as two stacks as well (absolute before the gap, distance-from-end after it),
+  so line lookups are O(log lines) via bisect.
+- Rope: persistent balanced tree of short strings with cached lengths and newline
+  counts. Insert/delete/index/line lookup are O(log n) anywhere in the document,
+  and a snapshot is just the root pointer (cheap UndoRedo checkpoints).
+Both expose the same small API: len, [i], [a:b], str, insert, delete, line_count,
+line_start, line. `insert_command` / `delete_command` turn edits into Commands.
+"""
+from __future__ import annotations
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import load_sibling
+
+_undo = load_sibling(__file__, "5_undo_redo_manager.py")
+Command, UndoRedo = _undo.Command, _undo.UndoRedo
+
+def _newlines(s: str, base: int) -> Iterable[int]:
+    i = s.find("\n")
+    while i != -1:
+        yield base + i
+        i = s.find("\n", i + 1)
+
+class GapBuffer:
+    __slots__ = ("_left", "_right", "_nl_left", "_nl_right")
+
+    def __init__(self, text: str = ""):
+        self._left: list[str] = list(text)     # chars before the gap, in order
+        self._right: list[str] = []            # chars after the gap, reversed (top = next char)
+        self._nl_left: list[int] = list(_newlines(text, 0))  # absolute positions, ascending
+        self._nl_right: list[int] = []         # len(doc) - pos, ascending (top = nearest gap)
+
+    def __len__(self) -> int:
+        return len(self._left) + len(self._right)
+
+    def _move_gap(self, p: int) -> None:
+        left, right = self._left, self._right
+        L = len(left)
+        if p < L:
+            n = len(self)
+            chunk = left[p:]
+            del left[p:]
+            right.extend(reversed(chunk))
+            k = bisect_left(self._nl_left, p)
+            moved = self._nl_left[k:]
+            del self._nl_left[k:]
+            self._nl_right.extend(n - q for q in reversed(moved))
+        elif p > L:
+            n = len(self)
+            d = p - L
+            chunk = right[-d:]
+            del right[-d:]
+            left.extend(reversed(chunk))
+            k = bisect_right(self._nl_right, n - p)
+            moved = self._nl_right[k:]
+            del self._nl_right[k:]
+            self._nl_left.extend(n - dist for dist in reversed(moved))
+
+    def insert(self, pos: int, s: str) -> None:
+        if not 0 <= pos <= len(self):
+            raise IndexError("insert position out of range")
+        self._move_gap(pos)
+        self._left.extend(s)
+        self._nl_left.extend(_newlines(s, pos))
+
+    def delete(self, pos: int, count: int) -> str:
+        if pos < 0 or count < 0 or pos + count > len(self):
+            raise IndexError("delete range out of range")
+        if not count:
+            return ""
+        n = len(self)
+        self._move_gap(pos)
+        chunk = self._right[-count:]
+        del self._right[-count:]
+        k = bisect_right(self._nl_right, n - pos - count)
+        del self._nl_right[k:]
+        return "".join(reversed(chunk))
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        n, L = len(self), len(self._left)
+        if isinstance(key, slice):
+            a, b, step = key.indices(n)
+            if step != 1:
+                return "".join(self[i] for i in range(a, b, step))
+            if b <= a:
+                return ""
+            R = len(self._right)
+            head = "".join(self._left[a:min(b, L)]) if a < L else ""
+            a2 = max(a, L)
+            tail = "".join(reversed(self._right[R - (b - L):R - (a2 - L)])) if b > L else ""
+            return head + tail
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("GapBuffer index out of range")
+        return self._left[key] if key < L else self._right[len(self._right) - 1 - (key - L)]
+
+    def __str__(self) -> str:
+        return "".join(self._left) + "".join(reversed(self._right))
+
+    def _newline_pos(self, k: int) -> int:
+        if k < len(self._nl_left):
+            return self._nl_left[k]
+        j = k - len(self._nl_left)
+        return len(self) - self._nl_right[len(self._nl_right) - 1 - j]
+
+    def line_count(self) -> int:
+        return len(self._nl_left) + len(self._nl_right) + 1
+
+    def line_start(self, i: int) -> int:
+        if not 0 <= i < self.line_count():
+            raise IndexError("line out of range")
+        return 0 if i == 0 else self._newline_pos(i - 1) + 1
+
+    def line(self, i: int) -> str:
+        start = self.line_start(i)
+        end = self._newline_pos(i) if i + 1 < self.line_count() else len(self)
+        return self[start:end]
+
+    def snapshot(self) -> str:
+        return str(self)
+
+    def restore(self, text: str) -> None:
+        self.__init__(text)
+
+# ---- Rope ----------------------------------------------------------------
+
+_LEAF_MAX = 1024
+
+class _Leaf:
+    __slots__ = ("text", "length", "newlines", "depth")
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+        self.newlines = text.count("\n")
+        self.depth = 0
+
+class _Node:
+    __slots__ = ("left", "right", "length", "newlines", "depth")
+    def __init__(self, left, right):
+        self.left, self.right = left, right
+        self.length = left.length + right.length
+        self.newlines = left.newlines + right.newlines
+        self.depth = 1 + max(left.depth, right.depth)
+
+def _concat(a, b):
+    if a is None or not a.length: return b
+    if b is None or not b.length: return a
+    if isinstance(a, _Leaf) and isinstance(b, _Leaf) and a.length + b.length <= _LEAF_MAX:
+        return _Leaf(a.text + b.text)
+    return _Node(a, b)
+
+def _split(node, i: int):
+    # returns (first i chars, rest); recursion depth is bounded by the tree depth
+    if node is None or i <= 0: return None, node
+    if i >= node.length: return node, None
+    if isinstance(node, _Leaf):
+        return _Leaf(node.text[:i]), _Leaf(node.text[i:])
+    if i < node.left.length:
+        l, r = _split(node.left, i)
+        return l, _concat(r, node.right)
+    l, r = _split(node.right, i - node.left.length)
+    return _concat(node.left, l), r
+
+def _build(leaves: list, lo: int, hi: int):
+    if hi - lo == 1: return leaves[lo]
+    mid = (lo + hi) // 2
+    return _Node(_build(leaves, lo, mid), _build(leaves, mid, hi))
+
+def _from_text(text: str):
+    if not text: return None
+    leaves = [_Leaf(text[i:i + _LEAF_MAX]) for i in range(0, len(text), _LEAF_MAX)]
+    return _build(leaves, 0, len(leaves))
+
+def _leaves(node) -> Iterable[_Leaf]:
+    st = [node] if node is not None else []
+    while st:
+        cur = st.pop()
+        if isinstance(cur, _Leaf):
+            yield cur
+        else:
+            st.append(cur.right); st.append(cur.left)
+
+class Rope:
+    __slots__ = ("_root",)
+
+    def __init__(self, text: str = ""):
+        self._root = _from_text(text)
+
+    def __len__(self) -> int:
+        return self._root.length if self._root else 0
+
+    def _rebalance_if_needed(self) -> None:
+        root = self._root
+        if root is None:
+            return
+        leaves_estimate = max(1, root.length // (_LEAF_MAX // 2))
+        if root.depth > 2 * leaves_estimate.bit_length() + 8:
+            # merge small neighbouring leaves, then rebuild perfectly balanced
+            merged: list[_Leaf] = []
+            for leaf in _leaves(root):
+                if merged and merged[-1].length + leaf.length <= _LEAF_MAX:
+                    merged[-1] = _Leaf(merged[-1].text + leaf.text)
+                else:
+                    merged.append(leaf)
+            self._root = _build(merged, 0, len(merged))
+
+    def insert(self, pos: int, s: str) -> None:
+        if not 0 <= pos <= len(self):
+            raise IndexError("insert position out of range")
+        if not s:
+            return
+        l, r = _split(self._root, pos)
+        self._root = _concat(_concat(l, _from_text(s)), r)
+        self._rebalance_if_needed()
+
+    def delete(self, pos: int, count: int) -> str:
+        if pos < 0 or count < 0 or pos + count > len(self):
+            raise IndexError("delete range out of range")
+        l, rest = _split(self._root, pos)
+        mid, r = _split(rest, count)
+        self._root = _concat(l, r)
+        self._rebalance_if_needed()
+        return "".join(leaf.text for leaf in _leaves(mid))
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        n = len(self)
+        if isinstance(key, slice):
+            a, b, step = key.indices(n)
+            if step != 1:
+                return "".join(self[i] for i in range(a, b, step))
+            return self._slice(a, b) if b > a else ""
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("Rope index out of range")
+        node = self._root
+        while isinstance(node, _Node):
+            if key < node.left.length:
+                node = node.left
+            else:
+                key -= node.left.length; node = node.right
+        return node.text[key]
+
+    def _slice(self, a: int, b: int) -> str:
+        out: list[str] = []
+        st = [(self._root, 0)]
+        while st:
+            node, off = st.pop()
+            if off >= b or off + node.length <= a:
+                continue
+            if isinstance(node, _Leaf):
+                out.append(node.text[max(0, a - off):b - off])
+            else:
+                st.append((node.right, off + node.left.length))
+                st.append((node.left, off))
+        return "".join(out)
+
+    def __str__(self) -> str:
+        return "".join(leaf.text for leaf in _leaves(self._root))
+
+    def _newline_pos(self, k: int) -> int:
+        node, pos = self._root, 0
+        while isinstance(node, _Node):
+            if k < node.left.newlines:
+                node = node.left
+            else:
+                k -= node.left.newlines; pos += node.left.length; node = node.right
+        i = -1
+        for _ in range(k + 1):
+            i = node.text.find("\n", i + 1)
+        return pos + i
+
+    def line_count(self) -> int:
+        return (self._root.newlines if self._root else 0) + 1
+
+    def line_start(self, i: int) -> int:
+        if not 0 <= i < self.line_count():
+            raise IndexError("line out of range")
+        return 0 if i == 0 else self._newline_pos(i - 1) + 1
+
+    def line(self, i: int) -> str:
+        start = self.line_start(i)
+        end = self._newline_pos(i) if i + 1 < self.line_count() else len(self)
+        return self[start:end]
+
+    def snapshot(self):
+        return self._root  # nodes are immutable, so the root is a full snapshot
+
+    def restore(self, root) -> None:
+        self._root = root
+
+# ---- UndoRedo integration ------------------------------------------------
+
+TextBuffer = Union[GapBuffer, Rope]
+
+def insert_command(buf: TextBuffer, pos: int, s: str) -> Command:
+    def merge(nxt: Command) -> Optional[Command]:
+        # consecutive typing at the end of this insert coalesces into one step
+        if nxt.meta and nxt.meta[0] == "insert" and nxt.meta[1] is buf \
+                and nxt.meta[2] == pos + len(s) and not s.endswith(("\n", " ")):
+            return insert_command(buf, pos, s + nxt.meta[3])
+        return None
+    return Command(do=lambda: buf.insert(pos, s), undo=lambda: buf.delete(pos, len(s)),
+                   desc=f"insert {s!r} at {pos}", size=len(s), merge=merge,
+                   meta=("insert", buf, pos, s))
+
+def delete_command(buf: TextBuffer, pos: int, count: int) -> Command:
+    removed: list[str] = []  # captured on do() so undo restores exactly what was there
+    def do():
+        removed[:] = [buf.delete(pos, count)]
+    return Command(do=do, undo=lambda: buf.insert(pos, removed[0]),
+                   desc=f"delete {count} at {pos}", size=count,
+                   meta=("delete", buf, pos, count))
+
+def _bench(size: int = 1_000_000, edits: int = 10_000) -> None:
+    import random, time
+    rng = random.Random(42)
+    base = ("lorem ipsum dolor sit amet\n" * (size // 27 + 1))[:size]
+    # localized editing: a cursor that mostly types, sometimes backspaces, occasionally jumps
+    script, cur, n = [], size // 2, size
+    for _ in range(edits):
+        r = rng.random()
+        if r < 0.02:
+            cur = rng.randrange(n)
+        if r < 0.85 or cur == 0:
+            script.append(("ins", cur)); cur += 1; n += 1
+        else:
+            cur -= 1; n -= 1; script.append(("del", cur))
+
+    def run_list():
+        text = list(base)
+        for op, p in script:
+            if op == "ins": text.insert(p, "x")
+            else: text.pop(p)
+        return len(text)
+
+    def run_buf(buf: TextBuffer):
+        for op, p in script:
+            if op == "ins": buf.insert(p, "x")
+            else: buf.delete(p, 1)
+        return len(buf)
+
+    for label, fn in [("list[str]", run_list), ("GapBuffer", lambda: run_buf(GapBuffer(base))),
+                      ("Rope", lambda: run_buf(Rope(base)))]:
+        t0 = time.perf_counter()
+        final_len = fn()
+        print(f"{label:<10} {edits:,} edits on {size / 1e6:.0f}M chars: "
+              f"{time.perf_counter() - t0:.3f}s (len={final_len:,})")
+
+def _demo():
+    for cls in (GapBuffer, Rope):
+        buf = cls("hello\nworld\n")
+        mgr = UndoRedo(snapshot=buf.snapshot, restore=buf.restore, checkpoint_every=8)
+        pos = buf.line_start(1)
+        for i, ch in enumerate("big "):  # four keystrokes, coalesced into one undo step
+            mgr.apply(insert_command(buf, pos + i, ch))
+        mgr.apply(delete_command(buf, 0, 6))
+        print(f"{cls.__name__}: {str(buf)!r}, lines={buf.line_count()}, "
+              f"line(0)={buf.line(0)!r}, undo steps={len(mgr)}")
+        mgr.undo(); mgr.undo()
+        print(f"  after 2 undos: {str(buf)!r}")
+    _bench()
+
+if __name__ == "__main__":
+    _demo()
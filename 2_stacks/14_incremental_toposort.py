@@ -0,0 +1,173 @@
+"""
+Incremental topological order (Pearce–Kelly) for graphs that change one edge at a time.
+- add_edge(x, y): if x already precedes y nothing moves; otherwise two bounded DFS
+  passes (explicit stacks) find the affected region between ord[y] and ord[x], and only
+  those nodes are reassigned to the same set of positions
+- edges that would close a cycle are rejected with graphlib.CycleError carrying the path
+- remove_edge never invalidates an order, so it is O(1)
+- order()/position() expose the current order without recomputation
+"""
+from __future__ import annotations
+from collections import deque
+from graphlib import CycleError
+from typing import Dict, Hashable, Iterable, Iterator, List, Set
+
+Node = Hashable
+
+class IncrementalTopoOrder:
+    def __init__(self, graph: Dict[Node, Iterable[Node]] | None = None):
+        self._succ: Dict[Node, Set[Node]] = {}
+        self._pred: Dict[Node, Set[Node]] = {}
+        self._ord: Dict[Node, int] = {}
+        self._at: List[Node] = []  # position -> node
+        if graph:
+            self._bulk_load(graph)
+
+    def _bulk_load(self, graph: Dict[Node, Iterable[Node]]) -> None:
+        # initial order with Kahn's algorithm: O(n + m) instead of m incremental inserts
+        for u, vs in graph.items():
+            self.add_node(u)
+            for v in vs:
+                self.add_node(v)
+                self._succ[u].add(v); self._pred[v].add(u)
+        indeg = {u: len(p) for u, p in self._pred.items()}
+        ready = deque(u for u, d in indeg.items() if d == 0)
+        order: List[Node] = []
+        while ready:
+            u = ready.popleft()
+            order.append(u)
+            for v in self._succ[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    ready.append(v)
+        if len(order) != len(self._at):
+            raise CycleError("graph contains a cycle", self._stuck_cycle(indeg))
+        self._at = order
+        self._ord = {u: i for i, u in enumerate(order)}
+
+    def _stuck_cycle(self, indeg: Dict[Node, int]) -> List[Node]:
+        # every node Kahn could not emit has an un-emitted predecessor: walk those
+        # backwards until a node repeats, then flip the walk into edge direction
+        seen: Dict[Node, int] = {}
+        path: List[Node] = []
+        u = next(u for u, d in indeg.items() if d > 0)
+        while u not in seen:
+            seen[u] = len(path); path.append(u)
+            u = next(p for p in self._pred[u] if indeg[p] > 0)
+        cycle = path[seen[u]:]
+        cycle.reverse()
+        return cycle + [cycle[0]]
+
+    def add_node(self, u: Node) -> None:
+        if u not in self._ord:
+            self._ord[u] = len(self._at)
+            self._at.append(u)
+            self._succ[u] = set(); self._pred[u] = set()
+
+    def has_edge(self, x: Node, y: Node) -> bool:
+        return x in self._succ and y in self._succ[x]
+
+    def add_edge(self, x: Node, y: Node) -> None:
+        if x == y:
+            raise CycleError(f"edge {x!r} -> {y!r} would create a cycle", [x, x])
+        self.add_node(x); self.add_node(y)
+        if y in self._succ[x]:
+            return
+        lb, ub = self._ord[y], self._ord[x]
+        if lb > ub:
+            self._succ[x].add(y); self._pred[y].add(x)
+            return
+        forward = self._dfs_forward(y, x, ub)  # raises if x is reachable from y
+        backward = self._dfs_backward(x, lb)
+        self._reorder(backward, forward)
+        self._succ[x].add(y); self._pred[y].add(x)
+
+    def _dfs_forward(self, y: Node, x: Node, ub: int) -> List[Node]:
+        ord_, succ = self._ord, self._succ
+        parent: Dict[Node, Node] = {y: y}
+        st = [y]
+        while st:
+            u = st.pop()
+            for v in succ[u]:
+                if v == x:
+                    chain = [u]
+                    while chain[-1] != y:
+                        chain.append(parent[chain[-1]])
+                    chain.reverse()  # y -> ... -> u, and u -> x already exists
+                    raise CycleError(f"edge {x!r} -> {y!r} would create a cycle",
+                                     [x] + chain + [x])
+                if v not in parent and ord_[v] < ub:
+                    parent[v] = u
+                    st.append(v)
+        return list(parent)
+
+    def _dfs_backward(self, x: Node, lb: int) -> List[Node]:
+        ord_, pred = self._ord, self._pred
+        seen = {x}
+        st = [x]
+        while st:
+            u = st.pop()
+            for v in pred[u]:
+                if v not in seen and ord_[v] > lb:
+                    seen.add(v)
+                    st.append(v)
+        return list(seen)
+
+    def _reorder(self, backward: List[Node], forward: List[Node]) -> None:
+        # everything that must precede x (backward) goes before everything reachable
+        # from y (forward), reusing exactly the positions those nodes occupied
+        ord_ = self._ord
+        backward.sort(key=ord_.__getitem__)
+        forward.sort(key=ord_.__getitem__)
+        slots = sorted(ord_[u] for u in backward + forward)
+        for pos, u in zip(slots, backward + forward):
+            ord_[u] = pos
+            self._at[pos] = u
+
+    def remove_edge(self, x: Node, y: Node) -> None:
+        if not self.has_edge(x, y):
+            raise KeyError(f"no edge {x!r} -> {y!r}")
+        self._succ[x].discard(y); self._pred[y].discard(x)
+
+    def position(self, u: Node) -> int:
+        return self._ord[u]
+
+    def order(self) -> List[Node]:
+        return list(self._at)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._at)
+
+    def __len__(self) -> int:
+        return len(self._at)
+
+def _demo():
+    t = IncrementalTopoOrder({"app": ["lib"], "lib": ["core"], "tests": ["app"]})
+    print("initial:", t.order())
+    t.add_edge("codegen", "lib")
+    t.add_edge("tools", "tests")
+    print("after adds:", t.order())
+    try:
+        t.add_edge("core", "app")
+    except CycleError as e:
+        print("rejected:", e.args[0], "cycle:", e.args[1])
+
+    import random, time
+    n, m = 100_000, 200_000
+    rng = random.Random(1)
+    dag = IncrementalTopoOrder()
+    for u in range(n):
+        dag.add_node(u)
+    hidden = list(range(n)); rng.shuffle(hidden)  # edges follow a hidden order -> no cycles
+    rank = {u: i for i, u in enumerate(hidden)}
+    t0 = time.perf_counter()
+    for _ in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            dag.add_edge(*((a, b) if rank[a] < rank[b] else (b, a)))
+    dt = time.perf_counter() - t0
+    ok = all(dag.position(u) < dag.position(v) for u in range(n) for v in dag._succ[u])
+    print(f"{m:,} incremental edge inserts on {n:,} nodes: {dt:.2f}s, order valid: {ok}")
+
+if __name__ == "__main__":
+    _demo()
@@ -0,0 +1,189 @@
+"""
+Parallel DAG task scheduler on top of the toposort module (7_iterative_dfs_toposort.py).
+- In-degree counting with a ready queue: a node is submitted the moment its last
+  predecessor finishes, on a thread or process pool with a concurrency limit
+- Critical-path-first: the ready queue is a heap keyed by the longest remaining
+  (cost-weighted) path to a sink, computed once over topo_sort_dfs order
+- A failing task marks every transitive dependent as skipped; independent branches
+  keep running (or stop early with fail_fast=True)
+- Per-task timings (queue wait, run time, worker) to see where wall-clock time goes
+Edges follow the toposort convention: u -> v means u must finish before v starts.
+"""
+from __future__ import annotations
+import heapq, os, sys, threading, time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from graphlib import CycleError
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import load_sibling
+
+topo_sort_dfs = load_sibling(__file__, "7_iterative_dfs_toposort.py").topo_sort_dfs
+
+Node = Hashable
+
+@dataclass
+class TaskTiming:
+    submitted: float
+    started: float
+    finished: float
+    worker: str
+
+    @property
+    def queued(self) -> float:
+        return self.started - self.submitted
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+@dataclass
+class ScheduleResult:
+    results: Dict[Node, Any] = field(default_factory=dict)
+    errors: Dict[Node, BaseException] = field(default_factory=dict)
+    skipped: Set[Node] = field(default_factory=set)
+    timings: Dict[Node, TaskTiming] = field(default_factory=dict)
+    critical_path: List[Node] = field(default_factory=list)
+    wall: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.skipped
+
+    def report(self, top: int = 5) -> str:
+        busy = sum(t.duration for t in self.timings.values())
+        lines = [f"wall {self.wall:.3f}s, task time {busy:.3f}s "
+                 f"(parallelism {busy / self.wall if self.wall else 0:.2f}x), "
+                 f"{len(self.results)} ok / {len(self.errors)} failed / {len(self.skipped)} skipped",
+                 "critical path: " + " -> ".join(map(str, self.critical_path))]
+        slowest = sorted(self.timings.items(), key=lambda kv: -kv[1].duration)[:top]
+        for node, t in slowest:
+            lines.append(f"  {node!s:<12} run {t.duration:.3f}s  queued {t.queued:.3f}s  on {t.worker}")
+        return "\n".join(lines)
+
+def _timed_call(fn: Callable[[], Any]):
+    # runs in the worker; perf_counter is system-wide monotonic on the platforms we target
+    start = time.perf_counter()
+    value = fn()
+    return value, start, time.perf_counter(), f"{os.getpid()}/{threading.current_thread().name}"
+
+def _critical_paths(graph: Dict[Node, List[Node]], cost: Dict[Node, float]):
+    # longest cost-weighted path from each node to a sink, over reverse topological order
+    order = topo_sort_dfs(graph)
+    length: Dict[Node, float] = {}
+    nxt: Dict[Node, Optional[Node]] = {}
+    for u in reversed(order):
+        best, arg = 0.0, None
+        for v in graph.get(u, ()):
+            if length[v] > best:
+                best, arg = length[v], v
+        length[u] = cost.get(u, 1.0) + best
+        nxt[u] = arg
+    path: List[Node] = []
+    u = max(length, key=length.__getitem__, default=None)
+    while u is not None:
+        path.append(u); u = nxt[u]
+    return length, path
+
+def run_dag(graph: Dict[Node, List[Node]], tasks: Dict[Node, Callable[[], Any]],
+            max_workers: int = 4, use_processes: bool = False,
+            cost: Optional[Dict[Node, float]] = None, fail_fast: bool = False) -> ScheduleResult:
+    """Run tasks[node]() for every node as soon as all its predecessors succeeded.
+    With use_processes=True the callables must be picklable (module-level functions)."""
+    nodes: Dict[Node, None] = dict.fromkeys(graph)
+    for vs in graph.values():
+        nodes.update(dict.fromkeys(vs))
+    missing = [u for u in nodes if u not in tasks]
+    if missing:
+        raise ValueError(f"no task for nodes: {missing}")
+    indeg: Dict[Node, int] = dict.fromkeys(nodes, 0)
+    for vs in graph.values():
+        for v in vs:
+            indeg[v] += 1
+    # reject cycles up front: topo_sort_dfs itself does not detect them
+    left = dict(indeg)
+    st = [u for u in nodes if not left[u]]
+    seen = 0
+    while st:
+        u = st.pop(); seen += 1
+        for v in graph.get(u, ()):
+            left[v] -= 1
+            if not left[v]: st.append(v)
+    if seen < len(nodes):
+        raise CycleError("graph contains a cycle", [u for u in nodes if left[u]])
+
+    priority, path = _critical_paths(graph, cost or {})
+    res = ScheduleResult(critical_path=path)
+    ready: list = []  # heap of (-critical path length, seq, node)
+    seq = 0
+    for u in nodes:
+        if indeg[u] == 0:
+            heapq.heappush(ready, (-priority[u], seq, u)); seq += 1
+
+    def skip_dependents(u: Node) -> None:
+        st = list(graph.get(u, ()))
+        while st:
+            v = st.pop()
+            if v not in res.skipped:
+                res.skipped.add(v)
+                st.extend(graph.get(v, ()))
+
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    running: Dict[Future, tuple] = {}
+    t_start = time.perf_counter()
+    with pool_cls(max_workers=max_workers) as pool:
+        while ready or running:
+            while ready and len(running) < max_workers and not (fail_fast and res.errors):
+                _, _, u = heapq.heappop(ready)
+                if u in res.skipped:
+                    continue
+                running[pool.submit(_timed_call, tasks[u])] = (u, time.perf_counter())
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                u, submitted = running.pop(fut)
+                try:
+                    value, started, ended, worker = fut.result()
+                except BaseException as exc:
+                    res.errors[u] = exc
+                    res.timings[u] = TaskTiming(submitted, submitted, time.perf_counter(), "?")
+                    skip_dependents(u)
+                    continue
+                res.results[u] = value
+                res.timings[u] = TaskTiming(submitted, started, ended, worker)
+                for v in graph.get(u, ()):
+                    indeg[v] -= 1
+                    if indeg[v] == 0 and v not in res.skipped:
+                        heapq.heappush(ready, (-priority[v], seq, v)); seq += 1
+            if fail_fast and res.errors:
+                ready.clear()
+    res.wall = time.perf_counter() - t_start
+    if fail_fast and res.errors:
+        res.skipped.update(u for u in nodes if u not in res.results and u not in res.errors)
+    return res
+
+def _demo():
+    # a small build: 'link' waits on all objects, 'docs' is off the critical path
+    graph = {
+        "fetch": ["parse", "docs"],
+        "parse": ["compile_a", "compile_b", "compile_c"],
+        "compile_a": ["link"], "compile_b": ["link"], "compile_c": ["link"],
+        "link": ["test"], "docs": [], "test": [],
+    }
+    seconds = {"fetch": 0.05, "parse": 0.05, "compile_a": 0.2, "compile_b": 0.1,
+               "compile_c": 0.1, "link": 0.1, "docs": 0.15, "test": 0.05}
+    tasks = {u: (lambda s=s: time.sleep(s) or s) for u, s in seconds.items()}
+    res = run_dag(graph, tasks, max_workers=3, cost=seconds)
+    print(res.report())
+    print(f"serial would take {sum(seconds.values()):.2f}s")
+
+    def boom():
+        raise RuntimeError("compiler crashed")
+    res = run_dag(graph, {**tasks, "compile_b": boom}, max_workers=3, cost=seconds)
+    print("errors:", {u: str(e) for u, e in res.errors.items()}, "skipped:", sorted(res.skipped))
+
+if __name__ == "__main__":
+    _demo()
@@ -0,0 +1,123 @@
+"""
+Maximal rectangle of free cells in a 2D binary grid, built on the histogram technique
+of largest_rectangle_area (3_monotonic_stack_patterns.py):
+- row r's histogram counts consecutive free cells ending at r in each column; with NumPy
+  it is updated for the whole row in two vectorized ops (h += 1; h *= row)
+- each histogram is solved with one preallocated monotonic stack, reused for every row
+- returns the area and inclusive coordinates of the best rectangle
+- maximal_rectangles() solves many independent grids, optionally across processes
+Any non-zero cell counts as free. Grids may be NumPy arrays, lists of rows, or a flat
+bytes-like buffer with shape=(rows, cols).
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+class Rect(NamedTuple):
+    area: int
+    top: int
+    left: int
+    bottom: int  # inclusive
+    right: int   # inclusive
+
+_EMPTY = Rect(0, -1, -1, -1, -1)
+
+def _best_in_histogram(h: Sequence[int], st_start: List[int], st_h: List[int]) -> Tuple[int, int, int, int]:
+    """Largest rectangle under histogram h as (area, left, right_exclusive, height),
+    using caller-owned stacks of length >= len(h) + 1 and an explicit top pointer."""
+    n = len(h)
+    top = 0
+    best_a = best_l = best_r = best_h = 0
+    for i in range(n + 1):
+        x = h[i] if i < n else 0  # sentinel flushes the stack
+        start = i
+        while top and st_h[top - 1] > x:
+            top -= 1
+            idx, hh = st_start[top], st_h[top]
+            a = hh * (i - idx)
+            if a > best_a:
+                best_a, best_l, best_r, best_h = a, idx, i, hh
+            start = idx
+        st_start[top] = start; st_h[top] = x
+        top += 1
+    return best_a, best_l, best_r, best_h
+
+def _rows(grid: Any, shape: Optional[Tuple[int, int]]) -> Tuple[Iterable, int]:
+    if shape is not None:
+        rows, cols = shape
+        mv = memoryview(grid).cast("B")
+        if len(mv) != rows * cols:
+            raise ValueError("buffer size does not match shape")
+        return (mv[r * cols:(r + 1) * cols] for r in range(rows)), cols
+    if hasattr(grid, "ndim"):
+        if grid.ndim != 2:
+            raise ValueError("grid must be 2-D")
+        return grid, grid.shape[1]
+    grid = list(grid)
+    return grid, len(grid[0]) if grid else 0
+
+def maximal_rectangle(grid: Any, shape: Optional[Tuple[int, int]] = None) -> Rect:
+    rows, cols = _rows(grid, shape)
+    st_start, st_h = [0] * (cols + 1), [0] * (cols + 1)  # one stack for every row
+    best = _EMPTY
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None and (hasattr(grid, "ndim") or shape is not None):
+        h = np.zeros(cols, dtype=np.int64)
+        for r, row in enumerate(rows):
+            h += 1
+            h *= np.asarray(row) != 0  # reset columns where the cell is blocked (zero)
+            a, l, rr, hh = _best_in_histogram(h.tolist(), st_start, st_h)
+            if a > best.area:
+                best = Rect(a, r - hh + 1, l, r, rr - 1)
+        return best
+    h = [0] * cols
+    for r, row in enumerate(rows):
+        for c in range(cols):
+            h[c] = h[c] + 1 if row[c] else 0
+        a, l, rr, hh = _best_in_histogram(h, st_start, st_h)
+        if a > best.area:
+            best = Rect(a, r - hh + 1, l, r, rr - 1)
+    return best
+
+def maximal_rectangles(grids: Iterable[Any], processes: Optional[int] = None) -> List[Rect]:
+    """Solve independent grids; processes=0 runs serially, None uses os.cpu_count()."""
+    grids = list(grids)
+    if processes == 0 or len(grids) < 2:
+        return [maximal_rectangle(g) for g in grids]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(maximal_rectangle, grids, chunksize=max(1, len(grids) // 32)))
+
+def _demo():
+    grid = [
+        [1, 0, 1, 0, 0],
+        [1, 0, 1, 1, 1],
+        [1, 1, 1, 1, 1],
+        [1, 0, 0, 1, 0],
+    ]
+    print("list grid:", maximal_rectangle(grid))
+    flat = bytes(c for row in grid for c in row)
+    print("buffer grid:", maximal_rectangle(flat, shape=(4, 5)))
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not installed; skipping array grids")
+        return
+    import time
+    rng = np.random.default_rng(0)
+    big = (rng.random((2_000, 2_000)) < 0.97).astype(np.uint8)
+    t0 = time.perf_counter()
+    r = maximal_rectangle(big)
+    print(f"2000x2000 grid: {r} in {time.perf_counter() - t0:.2f}s")
+    assert big[r.top:r.bottom + 1, r.left:r.right + 1].all()
+    grids = [(rng.random((300, 300)) < 0.95).astype(np.uint8) for _ in range(16)]
+    for procs in (0, None):
+        t0 = time.perf_counter()
+        areas = [x.area for x in maximal_rectangles(grids, processes=procs)]
+        print(f"16 grids, processes={procs}: {time.perf_counter() - t0:.2f}s, max area {max(areas)}")
+
+if __name__ == "__main__":
+    _demo()
@@ -1,11 +1,13 @@
 """
 Two production-grade stack implementations:
-- ArrayStack (backed by Python list with amortized O(1) push/pop)
+- ArrayStack (backed by Python list with amortized O(1) push/pop; optional typed
+  `array.array` mode for compact numeric storage, bulk push/pop and buffer export)
 - LinkedListStack (singly linked list; predictable O(1) push/pop; no over-allocation)
-Includes micro-benchmarks to compare asymptotics and constant factors.
+Benchmarks live in 11_stack_benchmarks.py (ops/sec, latency percentiles, peak memory).
 """
 
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
 from typing import Generic, Iterable, Iterator, Optional, TypeVar
 
@@ -13,20 +15,46 @@ T = TypeVar("T")
 
 class ArrayStack(Generic[T]):
     __slots__ = ("_data",)
-    def __init__(self, items: Optional[Iterable[T]] = None):
-        self._data: list[T] = []
+    def __init__(self, items: Optional[Iterable[T]] = None, typecode: Optional[str] = None):
+        # typecode (e.g. "q", "d") stores raw machine values contiguously instead of
+        # boxed objects in a list: 8 bytes per int64 vs ~36 for list slot + int object
+        self._data: list[T] | array = [] if typecode is None else array(typecode)
         if items:
             self._data.extend(items)
+    @property
+    def typecode(self) -> Optional[str]:
+        return self._data.typecode if isinstance(self._data, array) else None
     def push(self, item: T) -> None:
         self._data.append(item)   # amortized O(1)
+    def push_many(self, items: Iterable[T]) -> None:
+        self._data.extend(items)  # one C-level loop instead of N method calls
     def pop(self) -> T:
         if not self._data:
             raise IndexError("pop from empty ArrayStack")
         return self._data.pop()   # amortized O(1)
+    def pop_many(self, n: int) -> list[T] | array:
+        # returns the top n items in pop order (top first); same container type as storage
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > len(self._data):
+            raise IndexError("pop_many: not enough items in ArrayStack")
+        cut = len(self._data) - n
+        chunk = self._data[cut:]
+        del self._data[cut:]
+        chunk.reverse()
+        return chunk
     def peek(self) -> T:
         if not self._data:
             raise IndexError("peek from empty ArrayStack")
         return self._data[-1]
+    def as_memoryview(self) -> memoryview:
+        # Zero-copy view of the live contents (bottom -> top), e.g. for
+        # numpy.frombuffer(...) or file.write(...). While the view is alive the
+        # underlying array cannot be resized (push/pop raise BufferError), so
+        # release it (`with stack.as_memoryview() as mv: ...`) before mutating again.
+        if not isinstance(self._data, array):
+            raise TypeError("buffer export requires a typed ArrayStack (pass typecode=...)")
+        return memoryview(self._data)
     def __len__(self) -> int:
         return len(self._data)
     def __bool__(self) -> bool:
@@ -85,23 +113,18 @@ def _demo():
     print("ArrayStack pop order:", list(arr))
     print("LinkedListStack pop order:", list(ll))
 
-    # Micro-benchmark (very small, just to show shape — not a rigorous perf test)
-    import time
+    print("=== Typed ArrayStack ===")
+    # timing lives in 11_stack_benchmarks.py; here we only show the memory difference
+    import sys
     N = 200_000
-    start = time.perf_counter()
-    for i in range(N):
-        arr.push(i)
-    while arr:
-        arr.pop()
-    t_arr = time.perf_counter() - start
-
-    start = time.perf_counter()
-    for i in range(N):
-        ll.push(i)
-    while ll:
-        ll.pop()
-    t_ll = time.perf_counter() - start
-    print(f"Amortized behavior — ArrayStack: {t_arr:.3f}s, LinkedListStack: {t_ll:.3f}s")
+    typed = ArrayStack[int](typecode="q")
+    typed.push_many(range(N))
+    boxed = list(range(N))
+    boxed_bytes = sys.getsizeof(boxed) + sum(sys.getsizeof(x) for x in boxed)
+    print(f"{N} ints — typed: {sys.getsizeof(typed._data):,} B, list: {boxed_bytes:,} B")
+    print("pop_many(3):", list(typed.pop_many(3)))
+    with typed.as_memoryview() as mv:
+        print("memoryview:", mv.format, mv.itemsize, "bytes/item,", mv.nbytes, "bytes total")
 
 if __name__ == "__main__":
     _demo()
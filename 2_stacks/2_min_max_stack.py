@@ -1,30 +1,80 @@
 """
 MinMaxStack: O(1) time for push, pop, top, get_min, get_max — using an auxiliary stack.
-Also shows a space-optimized technique where we only store deltas.
+Also shows a space-optimized technique (`compact=True`) where the auxiliary stacks only
+record changes of the running min/max, so their size is proportional to the number of
+new extremes rather than to the stack size. `typecode` stores values in `array.array`.
+Running aggregates (get_sum, get_mean, get_count) are maintained in O(1) as well. The
+sum is kept exactly (floats are scaled to integers), so popping never leaves rounding
+error behind: get_sum/get_mean are the correctly rounded values for what is on the stack.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+import math
+from array import array
+from collections import Counter
+from typing import Generic, Optional, TypeVar, Union
 
 T = TypeVar("T", int, float)
 
+_FRAC_BITS = 1074  # every finite double is an integer multiple of 2**-1074
+_ONE = 1 << _FRAC_BITS
+
+def _scaled(x: Union[int, float]) -> int:
+    # x * 2**1074 as an exact integer
+    if isinstance(x, int):
+        return x << _FRAC_BITS
+    n, d = x.as_integer_ratio()  # d is a power of two
+    return n << (_FRAC_BITS - d.bit_length() + 1)
+
+def _ratio(num: int, den: int) -> float:
+    # int / int is correctly rounded; only the overflow case needs help
+    try:
+        return num / den
+    except OverflowError:
+        return math.inf if (num > 0) == (den > 0) else -math.inf
+
 class MinMaxStack(Generic[T]):
-    def __init__(self):
-        self._data: list[T] = []
-        self._mins: list[T] = []
-        self._maxs: list[T] = []
+    def __init__(self, compact: bool = False, typecode: Optional[str] = None):
+        new = list if typecode is None else (lambda: array(typecode))
+        self._data: list[T] = new()
+        self._mins: list[T] = new()
+        self._maxs: list[T] = new()
+        self._compact = compact
+        self._exact = 0  # sum of the finite values on the stack, scaled by 2**1074
+        self._floats = 0  # float values on the stack: the sum is a float while any remain
+        self._special: Counter = Counter()  # inf / -inf / nan on the stack
+
+    def _account(self, x: T, sign: int) -> None:
+        if isinstance(x, float):
+            self._floats += sign
+            if not math.isfinite(x):
+                self._special["nan" if x != x else x] += sign
+                return
+        self._exact += sign * _scaled(x)
 
     def push(self, x: T) -> None:
         self._data.append(x)
-        self._mins.append(x if not self._mins else min(x, self._mins[-1]))
-        self._maxs.append(x if not self._maxs else max(x, self._maxs[-1]))
+        x = self._data[-1]  # typed storage may round (e.g. "f"); track the stored value
+        self._account(x, 1)
+        if self._compact:
+            # `<=`/`>=` so duplicates of the current extreme are recorded and pop cleanly
+            if not self._mins or x <= self._mins[-1]: self._mins.append(x)
+            if not self._maxs or x >= self._maxs[-1]: self._maxs.append(x)
+        else:
+            self._mins.append(x if not self._mins else min(x, self._mins[-1]))
+            self._maxs.append(x if not self._maxs else max(x, self._maxs[-1]))
 
     def pop(self) -> T:
         if not self._data:
             raise IndexError("pop from empty stack")
-        self._mins.pop(); self._maxs.pop()
-        return self._data.pop()
+        x = self._data.pop()
+        if self._compact:
+            if x == self._mins[-1]: self._mins.pop()
+            if x == self._maxs[-1]: self._maxs.pop()
+        else:
+            self._mins.pop(); self._maxs.pop()
+        self._account(x, -1)
+        return x
 
     def top(self) -> T:
         if not self._data:
@@ -33,6 +83,36 @@ class MinMaxStack(Generic[T]):
 
     def get_min(self) -> T: return self._mins[-1]
     def get_max(self) -> T: return self._maxs[-1]
+    def get_count(self) -> int: return len(self._data)
+
+    def _special_sum(self) -> Optional[float]:
+        sp = self._special
+        if sp["nan"] or (sp[math.inf] and sp[-math.inf]):
+            return math.nan
+        if sp[math.inf]:
+            return math.inf
+        if sp[-math.inf]:
+            return -math.inf
+        return None
+
+    def get_sum(self) -> T:
+        special = self._special_sum()
+        if special is not None:
+            return special
+        if self._floats:
+            return _ratio(self._exact, _ONE)
+        return self._exact >> _FRAC_BITS  # all ints: exact
+
+    def get_mean(self) -> float:
+        if not self._data:
+            raise IndexError("mean of empty stack")
+        special = self._special_sum()
+        if special is not None:
+            return special
+        return _ratio(self._exact, _ONE * len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 def _demo():
     s = MinMaxStack[int]()
@@ -50,5 +130,17 @@ def _demo():
         except IndexError:
             break
 
+    import random, sys
+    vals = [random.randint(0, 10**9) for _ in range(100_000)]
+    for kw in ({}, {"compact": True}, {"compact": True, "typecode": "q"}):
+        s = MinMaxStack[int](**kw)
+        for x in vals:
+            s.push(x)
+        size = sum(sys.getsizeof(v) for v in (s._data, s._mins, s._maxs))
+        if isinstance(s._data, list):  # boxed ints live outside the list itself
+            size += sum(sys.getsizeof(v) for v in s._data)
+        print(f"{kw or 'default'}: {len(s._mins)} mins, {len(s._maxs)} maxs, "
+              f"~{size:,} B total, mean={s.get_mean():.0f}")
+
 if __name__ == "__main__":
     _demo()
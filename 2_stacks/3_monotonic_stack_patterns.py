@@ -4,9 +4,16 @@ Monotonic stack patterns with three classical problems:
 2) Daily Temperatures
 3) Largest Rectangle in Histogram
 All solved in O(n) using a decreasing/increasing stack as appropriate.
+Streaming variants consume any iterator (e.g. a live sensor feed) and yield
+(index, answer) pairs the moment an answer is resolved; memory is bounded by the
+pending stack, not the input length. sliding_window_min/max use a monotonic deque:
+O(1) amortized per element and O(k) memory for window size k.
 """
 from __future__ import annotations
-from typing import List
+from bisect import bisect_right
+from collections import deque
+from itertools import chain
+from typing import Iterable, Iterator, List, Tuple
 
 def next_greater_elements_circular(nums: List[int]) -> List[int]:
     n = len(nums)
@@ -33,7 +40,7 @@ def largest_rectangle_area(heights: List[int]) -> int:
     # classic: append sentinel 0 to flush the stack
     st = []
     max_area = 0
-    for i, h in enumerate(heights + [0]):
+    for i, h in enumerate(chain(heights, (0,))):  # no copy of the input
         start = i
         while st and st[-1][1] > h:
             idx, hh = st.pop()
@@ -42,10 +49,79 @@ def largest_rectangle_area(heights: List[int]) -> int:
         st.append((start, h))
     return max_area
 
+def next_greater_stream(nums: Iterable[int], circular: bool = False) -> Iterator[Tuple[int, int]]:
+    """Yield (i, next greater value or -1). With circular=True the leftovers are resolved
+    at end of stream from the prefix record highs: the first element greater than x is
+    always a new running maximum, so those highs (increasing) are all we need to keep."""
+    st: List[Tuple[int, int]] = []  # (index, value), values decreasing
+    highs: List[int] = []           # prefix record highs, strictly increasing
+    for i, x in enumerate(nums):
+        while st and st[-1][1] < x:
+            yield st.pop()[0], x
+        st.append((i, x))
+        if circular and (not highs or x > highs[-1]):
+            highs.append(x)
+    while st:
+        j, x = st.pop()
+        k = bisect_right(highs, x) if circular else len(highs)
+        yield j, highs[k] if k < len(highs) else -1
+
+def daily_temperatures_stream(temps: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """Yield (day, days until warmer) as soon as the warmer day arrives; (day, 0) at end."""
+    st: List[Tuple[int, int]] = []
+    for i, t in enumerate(temps):
+        while st and st[-1][1] < t:
+            j = st.pop()[0]
+            yield j, i - j
+        st.append((i, t))
+    for j, _ in reversed(st):
+        yield j, 0
+
+def largest_rectangle_stream(heights: Iterable[int]) -> Iterator[Tuple[int, int, int]]:
+    """Yield (area, start, end) each time a larger rectangle is confirmed; the last
+    value yielded is the overall answer, matching largest_rectangle_area."""
+    st: List[Tuple[int, int]] = []
+    best = 0
+    for i, h in enumerate(chain(heights, (0,))):
+        start = i
+        while st and st[-1][1] > h:
+            idx, hh = st.pop()
+            if hh * (i - idx) > best:
+                best = hh * (i - idx)
+                yield best, idx, i
+            start = idx
+        st.append((start, h))
+
+def _sliding_window(nums: Iterable[int], k: int, better) -> Iterator[int]:
+    if k <= 0:
+        raise ValueError("window size must be positive")
+    dq: deque = deque()  # (index, value), monotonic so dq[0] is the window's answer
+    for i, x in enumerate(nums):
+        while dq and not better(dq[-1][1], x):
+            dq.pop()
+        dq.append((i, x))
+        if dq[0][0] <= i - k:
+            dq.popleft()
+        if i >= k - 1:
+            yield dq[0][1]
+
+def sliding_window_min(nums: Iterable[int], k: int) -> Iterator[int]:
+    return _sliding_window(nums, k, lambda kept, new: kept < new)
+
+def sliding_window_max(nums: Iterable[int], k: int) -> Iterator[int]:
+    return _sliding_window(nums, k, lambda kept, new: kept > new)
+
 def _demo():
     print("Next greater (circular):", next_greater_elements_circular([2,1,2,4,3]))
     print("Daily temperatures:", daily_temperatures([73,74,75,71,69,72,76,73]))
     print("Largest rectangle area:", largest_rectangle_area([2,1,5,6,2,3]))
 
+    print("Streaming next greater (circular):", sorted(next_greater_stream(iter([2,1,2,4,3]), True)))
+    print("Streaming daily temperatures:", list(daily_temperatures_stream(iter([73,74,75,71,69,72,76,73]))))
+    print("Streaming largest rectangle:", list(largest_rectangle_stream(iter([2,1,5,6,2,3]))))
+    feed = iter([4, 2, 12, 3, 8, 1, 7, 9, 5])
+    print("Window(3) min:", list(sliding_window_min(feed, 3)))
+    print("Window(3) max:", list(sliding_window_max([4, 2, 12, 3, 8, 1, 7, 9, 5], 3)))
+
 if __name__ == "__main__":
     _demo()
@@ -3,40 +3,193 @@ Undo/Redo manager using two stacks.
 - `do(action, inverse)` records forward and inverse operations.
 - `undo()` and `redo()` execute the right functions.
 This pattern underpins editors, spreadsheets, and CAD tools.
+For long sessions the history can be bounded (max_steps / max_bytes, oldest evicted
+first), adjacent commands coalesce through `Command.merge`, `with mgr.group():` turns
+several commands into one undo step, and periodic state checkpoints let `undo_many`
+jump far back without replaying every inverse operation. Checkpoints count towards
+max_bytes (sized by `snapshot_size`) and can be capped with max_checkpoints; when over
+budget, the oldest checkpoints go before any command is evicted.
 """
 from __future__ import annotations
+import sys
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Optional
 
 @dataclass
 class Command:
     do: callable
     undo: callable
     desc: str
+    size: int = 0  # estimated bytes retained by this command (for max_bytes)
+    # merge(next_cmd) -> combined command, or None if the two cannot coalesce
+    merge: Optional[Callable[["Command"], Optional["Command"]]] = None
+    meta: Any = None  # free-form payload for merge functions
 
 class UndoRedo:
-    def __init__(self):
-        self._done: list[Command] = []
+    def __init__(self, max_steps: Optional[int] = None, max_bytes: Optional[int] = None,
+                 snapshot: Optional[Callable[[], Any]] = None,
+                 restore: Optional[Callable[[Any], None]] = None,
+                 checkpoint_every: int = 0,
+                 snapshot_size: Callable[[Any], int] = sys.getsizeof,
+                 max_checkpoints: Optional[int] = None):
+        # snapshot() must return an immutable copy of the state; restore(s) reinstates it;
+        # snapshot_size(s) estimates the bytes it retains (getsizeof is shallow: pass a
+        # real estimate for containers)
+        if checkpoint_every and not (snapshot and restore):
+            raise ValueError("checkpoint_every needs snapshot and restore callbacks")
+        self._done: deque[Command] = deque()
         self._undone: list[Command] = []
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._bytes = 0  # sizes of every retained command (done and undone) and checkpoint
+        self._evicted = 0  # commands dropped from the bottom of the history
+        self._snapshot, self._restore = snapshot, restore
+        self._every = checkpoint_every
+        self._snapshot_size = snapshot_size
+        self.max_checkpoints = max_checkpoints
+        self._checkpoints: dict[int, tuple[Any, int]] = {}  # position -> (snapshot, size)
+        self._group: Optional[list[Command]] = None
+        if self._every:
+            self._add_checkpoint(0)
+
+    @property
+    def position(self) -> int:
+        # number of commands applied since the session started (including evicted ones)
+        return self._evicted + len(self._done)
+
+    def _add_checkpoint(self, pos: int) -> None:
+        snap = self._snapshot()
+        size = self._snapshot_size(snap)
+        self._checkpoints[pos] = (snap, size)
+        self._bytes += size
+
+    def _drop_checkpoint(self, pos: int) -> None:
+        entry = self._checkpoints.pop(pos, None)
+        if entry is not None:
+            self._bytes -= entry[1]
 
     def apply(self, cmd: Command) -> None:
         cmd.do()
-        self._done.append(cmd)
+        if self._group is not None:
+            self._group.append(cmd)
+        else:
+            self._record(cmd)
+
+    def _record(self, cmd: Command) -> None:
+        self._bytes -= sum(c.size for c in self._undone)
         self._undone.clear()
+        pos = self.position
+        for p in [p for p in self._checkpoints if p > pos]:  # redo branch is gone
+            self._drop_checkpoint(p)
+        last = self._done[-1] if self._done else None
+        merged = None
+        # never merge across a checkpoint: it pins the state *between* the two commands
+        if last is not None and last.merge is not None and pos not in self._checkpoints:
+            merged = last.merge(cmd)
+        if merged is not None:
+            self._done[-1] = merged
+            self._bytes += merged.size - last.size
+        else:
+            self._done.append(cmd)
+            self._bytes += cmd.size
+            if self._every and (pos + 1) % self._every == 0:
+                self._add_checkpoint(pos + 1)
+        self._evict()
+
+    def _over_budget(self) -> bool:
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        # checkpoints only speed up undo_many: shed the oldest ones first (dict order is
+        # creation order, and positions only grow along one branch)
+        ckpts = self._checkpoints
+        while ckpts and (
+            (self.max_checkpoints is not None and len(ckpts) > self.max_checkpoints)
+            or self._over_budget()
+        ):
+            self._drop_checkpoint(next(iter(ckpts)))
+        while self._done and (
+            (self.max_steps is not None and len(self._done) > self.max_steps)
+            or self._over_budget()
+        ):
+            old = self._done.popleft()
+            self._bytes -= old.size
+            self._evicted += 1
+            self._drop_checkpoint(self._evicted - 1)  # now below the reachable floor
+
+    @contextmanager
+    def group(self, desc: str = "group"):
+        """Record every command applied inside the block as a single undo step.
+        If the block raises, the commands applied so far are rolled back."""
+        if self._group is not None:  # nested groups fold into the outermost one
+            yield
+            return
+        cmds: list[Command] = []
+        self._group = cmds
+        try:
+            yield
+        except BaseException:
+            self._group = None
+            for c in reversed(cmds):
+                c.undo()
+            raise
+        self._group = None
+        if cmds:
+            def do_all():
+                for c in cmds: c.do()
+            def undo_all():
+                for c in reversed(cmds): c.undo()
+            self._record(Command(do_all, undo_all, desc, sum(c.size for c in cmds)))
 
     def undo(self) -> None:
+        if self._group is not None: raise RuntimeError("cannot undo inside a group")
         if not self._done: raise RuntimeError("nothing to undo")
         cmd = self._done.pop()
         cmd.undo()
         self._undone.append(cmd)
 
     def redo(self) -> None:
+        if self._group is not None: raise RuntimeError("cannot redo inside a group")
         if not self._undone: raise RuntimeError("nothing to redo")
         cmd = self._undone.pop()
         cmd.do()
         self._done.append(cmd)
 
+    def undo_many(self, k: int) -> None:
+        """Undo k steps, restoring the nearest checkpoint and replaying from there
+        when that touches fewer commands than k individual undos."""
+        if self._group is not None: raise RuntimeError("cannot undo inside a group")
+        if k > len(self._done): raise RuntimeError("nothing to undo")
+        if k <= 0: return
+        pos, target = self.position, self.position - k
+        lo = self._evicted
+        best = min((p for p in self._checkpoints if lo <= p <= pos),
+                   key=lambda p: abs(p - target), default=None)
+        if best is None or abs(best - target) + 1 >= k:
+            for _ in range(k):
+                self.undo()
+            return
+        if best <= target:
+            # restore, then replay forward the commands that stay in the done stack
+            self._restore(self._checkpoints[best][0])
+            for c in islice(self._done, best - lo, target - lo):
+                c.do()
+        else:
+            # restore a later checkpoint, then undo back down to the target
+            self._restore(self._checkpoints[best][0])
+            for c in reversed(list(islice(self._done, target - lo, best - lo))):
+                c.undo()
+        for _ in range(k):
+            self._undone.append(self._done.pop())
+
+    def __len__(self) -> int:
+        return len(self._done)
+
 def _demo():
-    text: list[str] = []  # emulate a rope/GapBuffer with a simple list for demo
+    text: list[str] = []  # plain list for brevity; see 13_text_buffers.py for GapBuffer/Rope
     mgr = UndoRedo()
 
     def insert(pos: int, ch: str):
@@ -51,5 +204,31 @@ def _demo():
     mgr.undo(); print("after undo:", "".join(text))
     mgr.redo(); print("after redo:", "".join(text))
 
+    # Keystroke coalescing: adjacent typed characters become one "type" step
+    def typed(pos: int, s: str) -> Command:
+        def do(): text[pos:pos] = s
+        def undo(): del text[pos:pos + len(s)]
+        def merge(nxt: Command) -> Optional[Command]:
+            if nxt.meta is None:  # not a typing command (e.g. a group)
+                return None
+            npos, ns = nxt.meta
+            if npos == pos + len(s) and " " not in s:  # break words into separate steps
+                return typed(pos, s + ns)
+            return None
+        return Command(do, undo, f"type {s!r} at {pos}", size=len(s), merge=merge, meta=(pos, s))
+
+    text.clear()
+    mgr = UndoRedo(max_steps=100, snapshot=lambda: tuple(text),
+                   restore=lambda snap: text.__setitem__(slice(None), snap),
+                   checkpoint_every=10)
+    for ch in "the quick brown fox jumps over the lazy dog " * 3:
+        mgr.apply(typed(len(text), ch))
+    print(f"typed {len(text)} chars as {len(mgr)} undo steps")
+    with mgr.group("shout"):
+        mgr.apply(typed(len(text), "HEY"))
+        mgr.apply(typed(len(text), "!!!"))
+    mgr.undo(); print("after undoing the group:", repr("".join(text)[-12:]))
+    mgr.undo_many(20); print("after undo_many(20):", repr("".join(text)))
+
 if __name__ == "__main__":
     _demo()
@@ -2,12 +2,18 @@
 Iterative binary-tree traversals using an explicit stack.
 - preorder, inorder, postorder (one-stack version using last-visited pointer)
 Also includes a succinct helper to build a tree from a level-order array.
+CompactTree stores the same shape as parallel typed arrays (values, left/right child
+indices) — ~16 bytes per node instead of a Python object each — with an O(n) builder,
+lazy generator traversals and a Morris inorder that needs no auxiliary stack.
 """
 from __future__ import annotations
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, List
+from itertools import zip_longest
+from typing import Iterator, Optional, List
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     val: int
     left: Optional['Node']=None
@@ -17,9 +23,9 @@ def build_tree(level: List[Optional[int]]) -> Optional[Node]:
     if not level: return None
     it = iter(level)
     root = Node(next(it))
-    q = [root]
-    for a,b in zip(it, it):
-        cur = q.pop(0)
+    q = deque([root])  # popleft is O(1); list.pop(0) made the build O(n^2)
+    for a,b in zip_longest(it, it):
+        cur = q.popleft()
         if a is not None:
             cur.left = Node(a); q.append(cur.left)
         if b is not None:
@@ -60,11 +66,145 @@ def postorder(root: Optional[Node]) -> List[int]:
                 last = st.pop()
     return out
 
+class CompactTree:
+    """Binary tree as parallel arrays; node 0 is the root and -1 means "no child"."""
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, typecode: str = "q"):
+        self.val = array(typecode)
+        self.left = array("i")
+        self.right = array("i")
+
+    def __len__(self) -> int:
+        return len(self.val)
+
+    @classmethod
+    def from_level_order(cls, level: List[Optional[int]], typecode: str = "q") -> "CompactTree":
+        # O(n): node ids are assigned in BFS order, so the FIFO "queue" is just a read
+        # cursor (`head`) over ids, and all three arrays are allocated up front
+        t = cls(typecode)
+        if not level or level[0] is None:
+            return t
+        t.val = array(typecode, [v for v in level if v is not None])
+        m = len(t.val)
+        idx = "q" if m >= 2**31 else "i"
+        left = t.left = array(idx, [-1]) * m
+        right = t.right = array(idx, [-1]) * m
+        head, nxt, n = 0, 1, len(level)
+        for i in range(1, n, 2):
+            if level[i] is not None:
+                left[head] = nxt; nxt += 1
+            if i + 1 < n and level[i + 1] is not None:
+                right[head] = nxt; nxt += 1
+            head += 1
+        return t
+
+    def preorder(self) -> Iterator[int]:
+        if not self.val: return
+        val, left, right = self.val, self.left, self.right
+        st = [0]
+        while st:
+            u = st.pop()
+            yield val[u]
+            if right[u] >= 0: st.append(right[u])
+            if left[u] >= 0: st.append(left[u])
+
+    def inorder(self) -> Iterator[int]:
+        val, left, right = self.val, self.left, self.right
+        st: list[int] = []
+        cur = 0 if self.val else -1
+        while cur >= 0 or st:
+            while cur >= 0:
+                st.append(cur); cur = left[cur]
+            cur = st.pop(); yield val[cur]; cur = right[cur]
+
+    def postorder(self) -> Iterator[int]:
+        val, left, right = self.val, self.left, self.right
+        st: list[int] = []
+        last, cur = -1, 0 if self.val else -1
+        while cur >= 0 or st:
+            if cur >= 0:
+                st.append(cur); cur = left[cur]
+            else:
+                peek = st[-1]
+                if right[peek] >= 0 and last != right[peek]:
+                    cur = right[peek]
+                else:
+                    yield val[peek]
+                    last = st.pop()
+
+    def morris_inorder(self) -> Iterator[int]:
+        # O(1) extra memory: temporarily threads each predecessor's right pointer back to
+        # its successor. If the caller stops early, the finally block keeps walking
+        # (without yielding) so every thread is removed and the tree is left intact.
+        val, left, right = self.val, self.left, self.right
+        cur = 0 if self.val else -1
+        emitting = True
+        try:
+            while cur >= 0:
+                if left[cur] < 0:
+                    if emitting: yield val[cur]
+                    cur = right[cur]
+                    continue
+                pred = left[cur]
+                while right[pred] >= 0 and right[pred] != cur:
+                    pred = right[pred]
+                if right[pred] < 0:
+                    right[pred] = cur  # thread
+                    cur = left[cur]
+                else:
+                    right[pred] = -1  # unthread
+                    if emitting: yield val[cur]
+                    cur = right[cur]
+        finally:
+            if cur >= 0:
+                emitting = False
+                while cur >= 0:
+                    if left[cur] < 0:
+                        cur = right[cur]; continue
+                    pred = left[cur]
+                    while right[pred] >= 0 and right[pred] != cur:
+                        pred = right[pred]
+                    if right[pred] < 0:
+                        right[pred] = cur; cur = left[cur]
+                    else:
+                        right[pred] = -1; cur = right[cur]
+
+def _bench(n: int = 1_000_000) -> None:
+    import time, tracemalloc
+    level = list(range(n))
+    for label, build, walks in [
+        ("Node objects", build_tree, [("inorder", lambda t: inorder(t))]),
+        ("CompactTree", CompactTree.from_level_order,
+         [("inorder", lambda t: sum(1 for _ in t.inorder())),
+          ("morris", lambda t: sum(1 for _ in t.morris_inorder()))]),
+    ]:
+        tracemalloc.start()
+        tree = build(level)
+        mem = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        t0 = time.perf_counter()
+        tree = build(level)
+        built = time.perf_counter() - t0
+        line = f"{label:<13} build {built:.2f}s, {mem / 2**20:6.1f} MiB"
+        for name, walk in walks:
+            t0 = time.perf_counter(); walk(tree)
+            line += f", {name} {time.perf_counter() - t0:.2f}s"
+        print(line)
+        del tree
+
 def _demo():
     root = build_tree([1,2,3,4,5,6,7,None,None,8,9])
     print("preorder:", preorder(root))
     print("inorder:", inorder(root))
     print("postorder:", postorder(root))
 
+    t = CompactTree.from_level_order([1,2,3,4,5,6,7,None,None,8,9])
+    print("compact preorder:", list(t.preorder()))
+    print("compact inorder:", list(t.inorder()), "morris:", list(t.morris_inorder()))
+    print("compact postorder:", list(t.postorder()))
+    _bench()
+
 if __name__ == "__main__":
     _demo()
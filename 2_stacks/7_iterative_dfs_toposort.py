@@ -3,9 +3,13 @@ Graph algorithms with an explicit stack:
 - Iterative DFS (with discovery/finish timestamps)
 - Topological sort using an explicit stack (DFS variant)
 Shows how to replace recursion and keep control over memory/stack depth.
+CSRGraph packs adjacency into two typed arrays (row offsets + neighbor ids) for graphs
+with tens of millions of edges; csr_dfs / csr_topo_sort keep visited and timestamp
+state in arrays and use parallel integer stacks, so no per-step objects are created.
 """
 from __future__ import annotations
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterable, List, Tuple
 
 def iterative_dfs(graph: Dict[int, List[int]], s: int):
     time = 0
@@ -50,6 +54,123 @@ def topo_sort_dfs(graph: Dict[int, List[int]]):
     out.reverse()
     return out
 
+class CSRGraph:
+    """Directed graph over nodes 0..n-1: neighbors of u are targets[offsets[u]:offsets[u+1]]."""
+    __slots__ = ("n", "offsets", "targets")
+
+    def __init__(self, n: int, offsets: array, targets: array):
+        self.n, self.offsets, self.targets = n, offsets, targets
+
+    @staticmethod
+    def _idx(n: int) -> str:
+        return "i" if n < 2**31 else "q"
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Tuple[int, int]]) -> "CSRGraph":
+        # counting sort by source: O(n + m), keeps each node's edges in input order
+        src, dst = array(cls._idx(n)), array(cls._idx(n))
+        for u, v in edges:
+            if not (0 <= u < n and 0 <= v < n):
+                raise ValueError(f"edge ({u}, {v}) out of range for n={n}")
+            src.append(u); dst.append(v)
+        offsets = array("q", [0]) * (n + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = offsets[:-1]
+        targets = array(cls._idx(n), [0]) * len(dst)
+        for u, v in zip(src, dst):
+            targets[fill[u]] = v; fill[u] += 1
+        return cls(n, offsets, targets)
+
+    @classmethod
+    def from_dict(cls, graph: Dict[int, List[int]]) -> "CSRGraph":
+        n = 1 + max((max(u, max(vs, default=u)) for u, vs in graph.items()), default=-1)
+        offsets = array("q", [0]) * (n + 1)
+        for u, vs in graph.items():
+            offsets[u + 1] = len(vs)
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        targets = array(cls._idx(n), [0]) * offsets[n]
+        for u, vs in graph.items():
+            targets[offsets[u]:offsets[u + 1]] = array(targets.typecode, vs)
+        return cls(n, offsets, targets)
+
+    def neighbors(self, u: int) -> array:
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def __len__(self) -> int:
+        return self.n
+
+def csr_dfs(g: CSRGraph, s: int):
+    """Same contract as iterative_dfs; disc/fini are arrays with -1 for unreached nodes.
+    The stack is two parallel arrays: node ids and each node's next edge index."""
+    off, tgt = g.offsets, g.targets
+    disc = array("q", [-1]) * g.n
+    fini = array("q", [-1]) * g.n
+    order = array(tgt.typecode)
+    nodes, ptr = array(tgt.typecode, [s]), array("q", [off[s]])
+    disc[s] = 0; time = 1
+    order.append(s)
+    while nodes:
+        u, e = nodes[-1], ptr[-1]
+        if e < off[u + 1]:
+            v = tgt[e]
+            ptr[-1] = e + 1
+            if disc[v] < 0:
+                disc[v] = time; time += 1
+                order.append(v)
+                nodes.append(v); ptr.append(off[v])
+        else:
+            fini[u] = time; time += 1
+            nodes.pop(); ptr.pop()
+    return order, disc, fini
+
+def csr_topo_sort(g: CSRGraph) -> array:
+    off, tgt = g.offsets, g.targets
+    seen = bytearray(g.n)
+    out = array(tgt.typecode)
+    nodes, ptr = array(tgt.typecode), array("q")
+    for s in range(g.n):
+        if seen[s]: continue
+        seen[s] = 1
+        nodes.append(s); ptr.append(off[s])
+        while nodes:
+            u, e = nodes[-1], ptr[-1]
+            if e < off[u + 1]:
+                v = tgt[e]
+                ptr[-1] = e + 1
+                if not seen[v]:
+                    seen[v] = 1
+                    nodes.append(v); ptr.append(off[v])
+            else:
+                out.append(u)
+                nodes.pop(); ptr.pop()
+    out.reverse()
+    return out
+
+def _bench(n: int = 200_000, m: int = 1_000_000) -> None:
+    import random, time, tracemalloc
+    rng = random.Random(7)
+    edges = [(u, v) if u < v else (v, u) for u, v in
+             ((rng.randrange(n), rng.randrange(n)) for _ in range(m)) if u != v]
+    d: Dict[int, List[int]] = {u: [] for u in range(n)}
+    for u, v in edges:
+        d[u].append(v)
+    g = CSRGraph.from_edges(n, edges)
+    for label, fn in [("dict + tuples", lambda: topo_sort_dfs(d)), ("CSR arrays", lambda: csr_topo_sort(g))]:
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        tracemalloc.start()  # separate pass: tracing every int box distorts timings
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"topo sort {label:<14} {dt:.2f}s, peak working memory {peak / 2**20:.1f} MiB")
+    print(f"graph storage: dict {sum(map(len, d.values())) * 8 / 2**20:.0f}+ MiB of list slots "
+          f"(plus int objects) vs CSR {(g.offsets.itemsize * len(g.offsets) + g.targets.itemsize * len(g.targets)) / 2**20:.1f} MiB")
+
 def _demo():
     g = {
         0:[1,2],
@@ -65,5 +186,11 @@ def _demo():
     print("fini times:", fini)
     print("Topo sort:", topo_sort_dfs(g))
 
+    csr = CSRGraph.from_dict(g)
+    order, disc, fini = csr_dfs(csr, 0)
+    print("CSR DFS order:", order.tolist(), "disc:", disc.tolist(), "fini:", fini.tolist())
+    print("CSR topo sort:", csr_topo_sort(csr).tolist())
+    _bench()
+
 if __name__ == "__main__":
     _demo()
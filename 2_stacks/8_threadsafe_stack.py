@@ -2,10 +2,19 @@
 Thread-safe stack using a lock and condition variable.
 Demonstrates producers/consumers pushing/popping concurrently without races.
 Note: CPython's GIL does not make non-atomic operations safe; we still need locks.
+- push_many / pop_many move whole batches under one lock acquisition
+- try_pop never waits for items; timeouts use the monotonic clock
+- StripedThreadSafeStack spreads items over several locked stacks (per-thread home
+  stripe, work-stealing pops) to cut contention; LIFO order is per stripe only.
+  Under the GIL batching is the big win; striping pays off on free-threaded builds.
 """
 from __future__ import annotations
-import threading, random, time
-from typing import Optional, Generic, TypeVar
+import itertools, threading, random, sys, time
+from pathlib import Path
+from typing import Iterable, Optional, Generic, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import deadline_after, time_left
 
 T = TypeVar("T")
 
@@ -13,22 +22,178 @@ class ThreadSafeStack(Generic[T]):
     def __init__(self):
         self._data: list[T] = []
         self._cv = threading.Condition()
+        self._waiting = 0  # consumers blocked in wait(); lets push skip notify()
 
     def push(self, item: T) -> None:
         with self._cv:
             self._data.append(item)
-            self._cv.notify()
+            if self._waiting:
+                self._cv.notify()
 
-    def pop(self, timeout: Optional[float] = None) -> T:
+    def push_many(self, items: Iterable[T]) -> None:
         with self._cv:
-            start = time.time()
+            before = len(self._data)
+            self._data.extend(items)
+            if self._waiting:
+                self._cv.notify(len(self._data) - before)
+
+    def _wait_for_items(self, timeout: Optional[float]) -> None:
+        # caller holds self._cv
+        if self._data:
+            return
+        deadline = deadline_after(timeout)
+        self._waiting += 1
+        try:
             while not self._data:
-                remaining = None if timeout is None else max(0, timeout - (time.time() - start))
-                if timeout is not None and remaining == 0:
-                    raise TimeoutError("pop timed out")
-                self._cv.wait(timeout=remaining)
+                self._cv.wait(timeout=time_left(deadline, "pop"))
+        finally:
+            self._waiting -= 1
+
+    def pop(self, timeout: Optional[float] = None) -> T:
+        with self._cv:
+            self._wait_for_items(timeout)
             return self._data.pop()
 
+    def pop_many(self, max_n: int, timeout: Optional[float] = None) -> list[T]:
+        # waits for at least one item, then takes up to max_n in pop order (top first)
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        with self._cv:
+            self._wait_for_items(timeout)
+            cut = max(0, len(self._data) - max_n)
+            batch = self._data[cut:]
+            del self._data[cut:]
+        batch.reverse()
+        return batch
+
+    def try_pop(self, default: Optional[T] = None) -> Optional[T]:
+        with self._cv:
+            return self._data.pop() if self._data else default
+
+    def __len__(self) -> int:
+        with self._cv:
+            return len(self._data)
+
+class StripedThreadSafeStack(Generic[T]):
+    def __init__(self, stripes: int = 8):
+        assert stripes > 0
+        self._stripes: list[list[T]] = [[] for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._cv = threading.Condition()  # only touched when a consumer has to block
+        self._waiting = 0
+        self._next_home = itertools.count()
+        self._local = threading.local()
+
+    def _home(self) -> int:
+        # round-robin assignment; thread idents are addresses and hash poorly
+        try:
+            return self._local.home
+        except AttributeError:
+            self._local.home = next(self._next_home) % len(self._stripes)
+            return self._local.home
+
+    def _wake(self, n: int) -> None:
+        # safe without the cv lock: a consumer bumps _waiting before its last scan
+        if self._waiting:
+            with self._cv:
+                self._cv.notify(n)
+
+    def push(self, item: T) -> None:
+        i = self._home()
+        with self._locks[i]:
+            self._stripes[i].append(item)
+        self._wake(1)
+
+    def push_many(self, items: Iterable[T]) -> None:
+        i = self._home()
+        with self._locks[i]:
+            stripe = self._stripes[i]
+            before = len(stripe)
+            stripe.extend(items)
+            added = len(stripe) - before
+        if added:
+            self._wake(added)
+
+    def _take(self, max_n: int) -> list[T]:
+        # home stripe first, then steal from the others
+        k = len(self._stripes)
+        home = self._home()
+        for j in range(k):
+            i = (home + j) % k
+            stripe = self._stripes[i]
+            if not stripe:  # racy peek is fine: we re-check under the lock
+                continue
+            with self._locks[i]:
+                if stripe:
+                    cut = max(0, len(stripe) - max_n)
+                    batch = stripe[cut:]
+                    del stripe[cut:]
+                    batch.reverse()
+                    return batch
+        return []
+
+    def pop_many(self, max_n: int, timeout: Optional[float] = None) -> list[T]:
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        batch = self._take(max_n)
+        if batch:
+            return batch
+        deadline = deadline_after(timeout)
+        with self._cv:
+            self._waiting += 1
+            try:
+                while True:
+                    batch = self._take(max_n)
+                    if batch:
+                        return batch
+                    self._cv.wait(timeout=time_left(deadline, "pop"))
+            finally:
+                self._waiting -= 1
+
+    def pop(self, timeout: Optional[float] = None) -> T:
+        return self.pop_many(1, timeout)[0]
+
+    def try_pop(self, default: Optional[T] = None) -> Optional[T]:
+        batch = self._take(1)
+        return batch[0] if batch else default
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._stripes)
+
+def bench_throughput(factory, threads: int = 32, items_per_producer: int = 20_000,
+                     batch: int = 1) -> float:
+    """Half the threads produce, half consume; returns items/sec through the stack."""
+    stk = factory()
+    producers = consumers = max(1, threads // 2)
+    total = producers * items_per_producer
+    per_consumer = [total // consumers + (i < total % consumers) for i in range(consumers)]
+    start = threading.Barrier(producers + consumers + 1)
+
+    def producer():
+        start.wait()
+        if batch == 1:
+            for i in range(items_per_producer):
+                stk.push(i)
+        else:
+            for lo in range(0, items_per_producer, batch):
+                stk.push_many(range(lo, min(items_per_producer, lo + batch)))
+
+    def consumer(quota: int):
+        start.wait()
+        while quota:
+            if batch == 1:
+                stk.pop(timeout=10); quota -= 1
+            else:
+                quota -= len(stk.pop_many(min(batch, quota), timeout=10))
+
+    ts = [threading.Thread(target=producer) for _ in range(producers)]
+    ts += [threading.Thread(target=consumer, args=(q,)) for q in per_consumer]
+    for t in ts: t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in ts: t.join()
+    return total / (time.perf_counter() - t0)
+
 def _demo():
     stk = ThreadSafeStack[int]()
     out = []
@@ -43,6 +208,16 @@ def _demo():
     t1 = threading.Thread(target=producer); t2 = threading.Thread(target=consumer)
     t1.start(); t2.start(); t1.join(); t2.join()
     print("popped values (not ordered):", out, "len=", len(out))
+    print("try_pop on empty:", stk.try_pop("empty"))
+
+    print("-- 32-thread throughput (items/sec) --")
+    for label, factory, batch in [
+        ("ThreadSafeStack, single ops", ThreadSafeStack, 1),
+        ("ThreadSafeStack, batch=64", ThreadSafeStack, 64),
+        ("StripedThreadSafeStack, single ops", StripedThreadSafeStack, 1),
+        ("StripedThreadSafeStack, batch=64", StripedThreadSafeStack, 64),
+    ]:
+        print(f"{label:<36} {bench_throughput(factory, batch=batch):>12,.0f}")
 
 if __name__ == "__main__":
     _demo()
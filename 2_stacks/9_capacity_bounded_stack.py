@@ -4,9 +4,13 @@ Capacity-bounded stack with configurable overflow policy:
 - DROP_OLDEST: remove bottom-most element before pushing new one
 - IGNORE: ignore the new element when full
 Useful for fixed-memory systems or bounded history buffers.
+Backed by a preallocated ring buffer (optionally a typed `array.array`), so every
+push/pop is O(1) under all policies and no allocation happens after construction.
 """
 from __future__ import annotations
+from array import array
 from enum import Enum
+from typing import Iterator, Optional, Tuple
 
 class OverflowPolicy(Enum):
     RAISE = 1
@@ -14,29 +18,72 @@ class OverflowPolicy(Enum):
     IGNORE = 3
 
 class BoundedStack:
-    def __init__(self, capacity: int, policy: OverflowPolicy = OverflowPolicy.RAISE):
+    def __init__(self, capacity: int, policy: OverflowPolicy = OverflowPolicy.RAISE,
+                 typecode: Optional[str] = None):
         assert capacity > 0
         self.capacity = capacity
         self.policy = policy
-        self._data: list[int] = []
+        self._buf = [None] * capacity if typecode is None else array(typecode, [0]) * capacity
+        self._typed = typecode is not None
+        self._bottom = 0  # slot of the oldest element
+        self._size = 0
 
     def push(self, x: int) -> None:
-        if len(self._data) >= self.capacity:
+        cap = self.capacity
+        if self._size >= cap:
             if self.policy == OverflowPolicy.RAISE:
                 raise OverflowError("stack full")
             elif self.policy == OverflowPolicy.DROP_OLDEST:
-                # drop bottom-most element (index 0); O(n) but acceptable for small caps
-                self._data.pop(0)
+                # overwrite the bottom slot and advance the bottom: O(1)
+                self._buf[self._bottom] = x
+                self._bottom = self._bottom + 1 if self._bottom + 1 < cap else 0
+                return
             elif self.policy == OverflowPolicy.IGNORE:
                 return
-        self._data.append(x)
+        i = self._bottom + self._size
+        self._buf[i if i < cap else i - cap] = x
+        self._size += 1
 
     def pop(self) -> int:
-        if not self._data: raise IndexError("empty")
-        return self._data.pop()
+        if not self._size: raise IndexError("empty")
+        self._size -= 1
+        i = self._bottom + self._size
+        if i >= self.capacity: i -= self.capacity
+        x = self._buf[i]
+        if not self._typed:
+            self._buf[i] = None  # don't keep popped objects alive
+        return x
+
+    def peek(self) -> int:
+        if not self._size: raise IndexError("empty")
+        i = self._bottom + self._size - 1
+        return self._buf[i if i < self.capacity else i - self.capacity]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[int]:
+        # LIFO iteration over the live window, lazily, without copying
+        buf, cap, bottom = self._buf, self.capacity, self._bottom
+        for k in range(self._size - 1, -1, -1):
+            i = bottom + k
+            yield buf[i if i < cap else i - cap]
+
+    def segments(self) -> Tuple:
+        """Live window bottom -> top as one or two contiguous pieces.
+        Typed stacks return zero-copy memoryviews; list-backed ones return list slices."""
+        buf = memoryview(self._buf) if self._typed else self._buf
+        end = self._bottom + self._size
+        if end <= self.capacity:
+            return (buf[self._bottom:end],)
+        return (buf[self._bottom:], buf[:end - self.capacity])
 
     def __repr__(self) -> str:
-        return f"BoundedStack({self._data}, cap={self.capacity}, policy={self.policy.name})"
+        window = [x for seg in self.segments() for x in seg]
+        return f"BoundedStack({window}, cap={self.capacity}, policy={self.policy.name})"
 
 def _demo():
     print("-- RAISE --")
@@ -57,5 +104,14 @@ def _demo():
     for i in (7,8,9):
         s.push(i); print(s)
 
+    print("-- DROP_OLDEST, typed ring buffer as 100k-entry history --")
+    import time
+    s = BoundedStack(100_000, OverflowPolicy.DROP_OLDEST, typecode="q")
+    t0 = time.perf_counter()
+    for i in range(1_000_000):
+        s.push(i)
+    print(f"1M pushes: {time.perf_counter() - t0:.3f}s, top={s.peek()}, "
+          f"segments={[len(seg) for seg in s.segments()]}")
+
 if __name__ == "__main__":
     _demo()
@@ -0,0 +1,153 @@
+"""
+FIFO queue on a preallocated ring buffer (list slots or a typed `array.array`).
+- enqueue/dequeue are O(1) index arithmetic: nothing shifts, nothing is allocated until
+  the buffer is full
+- a full buffer doubles (grow=True) or raises OverflowError (grow=False, fixed memory)
+- put_many/get_many copy whole runs with at most two slice assignments
+Typed buffers store machine values (e.g. typecode "d" or "q") without per-item objects.
+"""
+from __future__ import annotations
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional
+
+class RingBufferQueue:
+    def __init__(self, capacity: int = 16, typecode: Optional[str] = None, grow: bool = True):
+        assert capacity > 0
+        self.typecode = typecode
+        self.grow = grow
+        self._buf = self._alloc(capacity)
+        self._head = 0  # slot of the oldest item
+        self._size = 0
+
+    def _alloc(self, capacity: int):
+        return [None] * capacity if self.typecode is None else array(self.typecode, [0]) * capacity
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def _resize(self, capacity: int) -> None:
+        items = self._runs(self._size)
+        buf = self._alloc(capacity)
+        n = 0
+        for run in items:
+            buf[n:n + len(run)] = run
+            n += len(run)
+        self._buf, self._head = buf, 0
+
+    def _ensure_room(self, extra: int) -> None:
+        need = self._size + extra
+        cap = len(self._buf)
+        if need <= cap:
+            return
+        if not self.grow:
+            raise OverflowError("queue full")
+        while cap < need:
+            cap *= 2
+        self._resize(cap)
+
+    def _runs(self, n: int) -> list:
+        # the first n items as at most two contiguous slices of the buffer
+        buf, head, cap = self._buf, self._head, len(self._buf)
+        end = head + n
+        if end <= cap:
+            return [buf[head:end]]
+        return [buf[head:cap], buf[:end - cap]]
+
+    def enqueue(self, x: Any) -> None:
+        if self._size == len(self._buf):
+            self._ensure_room(1)
+        cap = len(self._buf)
+        i = self._head + self._size
+        self._buf[i - cap if i >= cap else i] = x
+        self._size += 1
+
+    def dequeue(self) -> Any:
+        if not self._size:
+            raise IndexError("dequeue from empty queue")
+        buf, head = self._buf, self._head
+        x = buf[head]
+        if self.typecode is None:
+            buf[head] = None  # drop the reference
+        head += 1
+        self._head = 0 if head == len(buf) else head
+        self._size -= 1
+        return x
+
+    def peek(self) -> Any:
+        if not self._size:
+            raise IndexError("peek from empty queue")
+        return self._buf[self._head]
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        items = list(items) if self.typecode is None else array(self.typecode, items)
+        k = len(items)
+        if not k:
+            return
+        self._ensure_room(k)
+        buf, cap = self._buf, len(self._buf)
+        start = self._head + self._size
+        if start >= cap:
+            start -= cap
+        first = min(k, cap - start)
+        buf[start:start + first] = items[:first]
+        if first < k:
+            buf[:k - first] = items[first:]
+        self._size += k
+
+    def get_many(self, max_n: int) -> List[Any]:
+        """Up to max_n items in FIFO order (fewer if the queue holds fewer)."""
+        n = min(max_n, self._size)
+        if n <= 0:
+            return []
+        out: List[Any] = []
+        for run in self._runs(n):
+            out.extend(run)
+        if self.typecode is None:
+            buf, cap = self._buf, len(self._buf)
+            end = self._head + n
+            if end <= cap:
+                buf[self._head:end] = [None] * n
+            else:
+                buf[self._head:cap] = [None] * (cap - self._head)
+                buf[:end - cap] = [None] * (end - cap)
+        self._head = (self._head + n) % len(self._buf)
+        self._size -= n
+        return out
+
+    def clear(self) -> None:
+        self._buf = self._alloc(len(self._buf))
+        self._head = self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        # oldest first, without removing anything
+        for run in self._runs(self._size):
+            yield from run
+
+    def __repr__(self) -> str:
+        return f"RingBufferQueue({list(self)!r}, capacity={len(self._buf)})"
+
+def _demo():
+    q = RingBufferQueue(capacity=4)
+    for i in range(6):
+        q.enqueue(i)
+    print(q)
+    print("dequeue:", q.dequeue(), q.dequeue())
+    q.put_many(range(10, 14))
+    print("get_many(5):", q.get_many(5), "left:", list(q))
+
+    fixed = RingBufferQueue(capacity=3, typecode="d", grow=False)
+    fixed.put_many([1.5, 2.5, 3.5])
+    try:
+        fixed.enqueue(4.5)
+    except OverflowError as e:
+        print("fixed-size queue:", e)
+
+if __name__ == "__main__":
+    _demo()
@@ -0,0 +1,168 @@
+"""
+Bounded single-producer / single-consumer queue with no lock on the fast path.
+- a power-of-two ring of slots with two ever-increasing counters: only the producer
+  writes `_tail`, only the consumer writes `_head`, so neither side needs a lock
+- the producer fills the slot before publishing the new tail, and the consumer
+  clears the slot before publishing the new head
+- blocking put/get only touch an Event when the other side is actually parked: the
+  waiter raises its flag and re-checks, the other side publishes and then checks the flag
+- put_many/get_many move whole runs per publication
+Correct for exactly one producer thread and one consumer thread. It relies on the GIL
+making single attribute and slot stores atomic and ordered; use the MPMC queue
+(3_mpmc_blocking_queue.py) for anything else, or on free-threaded builds.
+"""
+from __future__ import annotations
+import sys, threading, time
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import deadline_after, time_left
+
+class SPSCQueue:
+    def __init__(self, capacity: int = 1024):
+        assert capacity > 0
+        cap = 1 << (capacity - 1).bit_length()  # round up so that index = counter & mask
+        self._slots: List[Any] = [None] * cap
+        self._mask = cap - 1
+        self._head = 0  # items taken so far (consumer-owned)
+        self._tail = 0  # items published so far (producer-owned)
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    # -- producer side ------------------------------------------------------
+
+    def _publish(self, tail: int) -> None:
+        self._tail = tail
+        if self._consumer_waiting:
+            self._not_empty.set()
+
+    def try_put(self, x: Any) -> bool:
+        tail = self._tail
+        if tail - self._head == len(self._slots):
+            return False
+        self._slots[tail & self._mask] = x
+        self._publish(tail + 1)
+        return True
+
+    def _wait_for_room(self, deadline: Optional[float]) -> int:
+        # returns the number of free slots, parking until there is at least one
+        cap = len(self._slots)
+        free = cap - (self._tail - self._head)
+        if free:
+            return free
+        ev = self._not_full
+        try:
+            while True:
+                ev.clear()
+                self._producer_waiting = True
+                free = cap - (self._tail - self._head)
+                if free:
+                    return free
+                ev.wait(time_left(deadline, "put"))
+        finally:
+            self._producer_waiting = False
+
+    def put(self, x: Any, timeout: Optional[float] = None) -> None:
+        if not self.try_put(x):
+            self._wait_for_room(deadline_after(timeout))
+            self.try_put(x)
+
+    def put_many(self, items: Iterable[Any], timeout: Optional[float] = None) -> None:
+        """Puts every item, publishing as many as fit at a time; the timeout covers the lot."""
+        items = list(items)
+        deadline = deadline_after(timeout)
+        slots, mask = self._slots, self._mask
+        i = 0
+        while i < len(items):
+            free = self._wait_for_room(deadline)
+            tail = self._tail
+            for x in items[i:i + free]:
+                slots[tail & mask] = x
+                tail += 1
+            i += free
+            self._publish(tail)
+
+    # -- consumer side ------------------------------------------------------
+
+    def _release(self, head: int) -> None:
+        self._head = head
+        if self._producer_waiting:
+            self._not_full.set()
+
+    def try_get(self, default: Any = None) -> Any:
+        head = self._head
+        if head == self._tail:
+            return default
+        slot = head & self._mask
+        x = self._slots[slot]
+        self._slots[slot] = None
+        self._release(head + 1)
+        return x
+
+    def _wait_for_items(self, deadline: Optional[float]) -> int:
+        avail = self._tail - self._head
+        if avail:
+            return avail
+        ev = self._not_empty
+        try:
+            while True:
+                ev.clear()
+                self._consumer_waiting = True
+                avail = self._tail - self._head
+                if avail:
+                    return avail
+                ev.wait(time_left(deadline, "get"))
+        finally:
+            self._consumer_waiting = False
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        self._wait_for_items(deadline_after(timeout))
+        return self.try_get()
+
+    def get_many(self, max_n: int, timeout: Optional[float] = None) -> List[Any]:
+        """Waits for at least one item, then takes up to max_n in FIFO order."""
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        n = min(max_n, self._wait_for_items(deadline_after(timeout)))
+        slots, mask, head = self._slots, self._mask, self._head
+        out = []
+        for c in range(head, head + n):
+            out.append(slots[c & mask])
+            slots[c & mask] = None
+        self._release(head + n)
+        return out
+
+    def __len__(self) -> int:
+        # exact from either owning thread; a snapshot from anywhere else
+        return self._tail - self._head
+
+def _demo():
+    q = SPSCQueue(capacity=1000)  # rounded up to 1024
+    total, batch = 500_000, 256
+    received: List[int] = []
+
+    def producer():
+        for lo in range(0, total, batch):
+            q.put_many(range(lo, min(total, lo + batch)), timeout=10)
+
+    def consumer():
+        while len(received) < total:
+            received.extend(q.get_many(batch, timeout=10))
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    t0 = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    dt = time.perf_counter() - t0
+    print(f"capacity {q.capacity}: moved {total:,} items in {dt:.2f}s "
+          f"({total / dt:,.0f} items/s), in order: {received == list(range(total))}")
+
+if __name__ == "__main__":
+    _demo()
@@ -0,0 +1,164 @@
+"""
+Multi-producer / multi-consumer blocking FIFO queue, optionally bounded.
+- one lock and two conditions (not_empty / not_full) over a deque
+- waiter counts let put/get skip notify() when nobody is parked
+- put_many/get_many move whole batches per lock acquisition: batching is what pays off
+  under the GIL, where per-item lock handoffs dominate queue.Queue's cost
+- timeouts use the monotonic clock and raise TimeoutError; try_put/try_get never wait
+"""
+from __future__ import annotations
+import sys, threading, time
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import deadline_after, time_left
+
+class BlockingQueue:
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize  # 0 means unbounded
+        self._items: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._getters = 0  # consumers parked on _not_empty
+        self._putters = 0  # producers parked on _not_full
+
+    def _free(self) -> int:
+        # caller holds the lock
+        return self.maxsize - len(self._items) if self.maxsize else sys.maxsize
+
+    def _wait_for_room(self, deadline: Optional[float]) -> int:
+        # caller holds the lock; returns the number of free slots (> 0)
+        free = self._free()
+        if free > 0:
+            return free
+        self._putters += 1
+        try:
+            while True:
+                self._not_full.wait(time_left(deadline, "put"))
+                free = self._free()
+                if free > 0:
+                    return free
+        finally:
+            self._putters -= 1
+
+    def _wait_for_items(self, deadline: Optional[float]) -> None:
+        # caller holds the lock
+        if self._items:
+            return
+        self._getters += 1
+        try:
+            while not self._items:
+                self._not_empty.wait(time_left(deadline, "get"))
+        finally:
+            self._getters -= 1
+
+    def _added(self, n: int) -> None:
+        if self._getters:
+            self._not_empty.notify(n)
+
+    def _removed(self, n: int) -> None:
+        if self._putters:
+            self._not_full.notify(n)
+
+    def put(self, x: Any, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._wait_for_room(deadline_after(timeout))
+            self._items.append(x)
+            self._added(1)
+
+    def try_put(self, x: Any) -> bool:
+        with self._lock:
+            if self._free() <= 0:
+                return False
+            self._items.append(x)
+            self._added(1)
+            return True
+
+    def put_many(self, items: Iterable[Any], timeout: Optional[float] = None) -> None:
+        """Puts every item in order; on a bounded queue, as many per wake-up as fit.
+        Items from one call stay in order but may interleave with other producers."""
+        items = list(items)
+        deadline = deadline_after(timeout)
+        i = 0
+        with self._lock:
+            while i < len(items):
+                free = self._wait_for_room(deadline)
+                chunk = items[i:i + free]
+                self._items.extend(chunk)
+                i += len(chunk)
+                self._added(len(chunk))
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        with self._lock:
+            self._wait_for_items(deadline_after(timeout))
+            x = self._items.popleft()
+            self._removed(1)
+            return x
+
+    def try_get(self, default: Any = None) -> Any:
+        with self._lock:
+            if not self._items:
+                return default
+            x = self._items.popleft()
+            self._removed(1)
+            return x
+
+    def get_many(self, max_n: int, timeout: Optional[float] = None) -> List[Any]:
+        """Waits for at least one item, then takes up to max_n in FIFO order."""
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        with self._lock:
+            self._wait_for_items(deadline_after(timeout))
+            items = self._items
+            if max_n >= len(items):
+                out = list(items)
+                items.clear()
+            else:
+                popleft = items.popleft
+                out = [popleft() for _ in range(max_n)]
+            self._removed(len(out))
+            return out
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+def _demo():
+    q = BlockingQueue(maxsize=10_000)
+    producers, consumers, per_producer, batch = 4, 4, 100_000, 256
+    total = producers * per_producer
+    counts = [0] * consumers
+    checksum = [0] * consumers
+    done = threading.Event()
+
+    def producer(p: int):
+        base = p * per_producer
+        for lo in range(0, per_producer, batch):
+            q.put_many(range(base + lo, base + min(per_producer, lo + batch)), timeout=10)
+
+    def consumer(c: int):
+        while not done.is_set():
+            try:
+                got = q.get_many(batch, timeout=0.05)
+            except TimeoutError:
+                continue
+            counts[c] += len(got)
+            checksum[c] += sum(got)
+            if sum(counts) >= total:
+                done.set()
+
+    threads = [threading.Thread(target=producer, args=(p,)) for p in range(producers)]
+    threads += [threading.Thread(target=consumer, args=(c,)) for c in range(consumers)]
+    t0 = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    dt = time.perf_counter() - t0
+    print(f"{producers}x{consumers} threads, batch {batch}: {total:,} items in {dt:.2f}s "
+          f"({total / dt:,.0f} items/s), per consumer {counts}, "
+          f"all items seen once: {sum(checksum) == total * (total - 1) // 2}")
+
+if __name__ == "__main__":
+    _demo()
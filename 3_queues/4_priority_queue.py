@@ -0,0 +1,116 @@
+"""
+Binary-heap priority queue (min-priority first) on top of heapq.
+- push/pop are O(log n); peek is O(1); push_many heapifies in O(n + k) when the batch
+  is large compared to the heap
+- equal priorities come out in insertion order (a sequence number breaks ties, so items
+  themselves are never compared)
+- update(item, priority) and remove(item) are O(log n) amortized via lazy deletion:
+  the old entry is marked dead and skipped when it reaches the top
+Items must be hashable to support update/remove; each item is queued at most once.
+"""
+from __future__ import annotations
+import heapq, itertools
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+_REMOVED = object()  # placeholder for an entry that was updated or removed
+
+class PriorityQueue:
+    def __init__(self, items: Iterable[Tuple[Hashable, Any]] = ()):
+        self._heap: List[list] = []  # [priority, seq, item]
+        self._entries: Dict[Hashable, list] = {}
+        self._seq = itertools.count()
+        self.push_many(items)
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        if item in self._entries:
+            raise KeyError(f"{item!r} is already queued; use update()")
+        entry = [priority, next(self._seq), item]
+        self._entries[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    def push_many(self, pairs: Iterable[Tuple[Hashable, Any]]) -> None:
+        batch: Dict[Hashable, list] = {}
+        for item, priority in pairs:
+            if item in self._entries or item in batch:
+                raise KeyError(f"{item!r} is already queued; use update()")
+            batch[item] = [priority, next(self._seq), item]
+        self._entries.update(batch)  # nothing is queued if the batch was rejected
+        fresh = list(batch.values())
+        if len(fresh) > len(self._heap) // 4:
+            self._heap.extend(fresh)
+            heapq.heapify(self._heap)
+        else:
+            for entry in fresh:
+                heapq.heappush(self._heap, entry)
+
+    def _drop_dead(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2] is _REMOVED:
+            heapq.heappop(heap)
+
+    def _kill(self, item: Hashable) -> None:
+        entry = self._entries.pop(item)
+        entry[2] = _REMOVED
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            # mostly dead entries: rebuild so memory and pop cost track the live size
+            self._heap = [e for e in self._heap if e[2] is not _REMOVED]
+            heapq.heapify(self._heap)
+
+    def update(self, item: Hashable, priority: Any) -> None:
+        """Change the priority of a queued item (or queue it if absent)."""
+        if item in self._entries:
+            self._kill(item)
+        self.push(item, priority)
+
+    def remove(self, item: Hashable) -> None:
+        if item not in self._entries:
+            raise KeyError(item)
+        self._kill(item)
+
+    def pop_with_priority(self) -> Tuple[Hashable, Any]:
+        heap = self._heap
+        while heap:
+            priority, _, item = heapq.heappop(heap)
+            if item is not _REMOVED:
+                del self._entries[item]
+                return item, priority
+        raise IndexError("pop from empty priority queue")
+
+    def pop(self) -> Hashable:
+        heap = self._heap
+        while heap:
+            item = heapq.heappop(heap)[2]
+            if item is not _REMOVED:
+                del self._entries[item]
+                return item
+        raise IndexError("pop from empty priority queue")
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        self._drop_dead()
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        priority, _, item = self._heap[0]
+        return item, priority
+
+    def priority(self, item: Hashable) -> Any:
+        return self._entries[item][0]
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+def _demo():
+    pq = PriorityQueue([("write report", 3), ("fix outage", 1), ("lunch", 5)])
+    pq.push("reply to email", 3)  # same priority as "write report": FIFO among equals
+    pq.update("lunch", 0)
+    pq.remove("reply to email")
+    print("peek:", pq.peek())
+    print("order:", [pq.pop_with_priority() for _ in range(len(pq))])
+
+if __name__ == "__main__":
+    _demo()
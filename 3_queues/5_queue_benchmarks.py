@@ -0,0 +1,246 @@
+"""
+Throughput benchmarks for the queue family against collections.deque and queue.Queue.
+Sections:
+- fifo: one thread, queue kept at a steady depth; one put + one get per item, and the
+  same with put_many/get_many batches
+- threads: producer/consumer threads (1x1 and 4x4) moving items through the queue
+- priority: n pushes of random priorities followed by n pops
+- lifo: StackViaQueues strategies against a deque used as a stack
+Prints items per second (higher is better); the best of --repeats runs is reported.
+"""
+from __future__ import annotations
+import argparse, heapq, queue, random, sys, threading, time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for _support
+from _support import load_sibling
+
+ring = load_sibling(__file__, "1_ring_buffer_queue.py")
+spsc = load_sibling(__file__, "2_spsc_queue.py")
+mpmc = load_sibling(__file__, "3_mpmc_blocking_queue.py")
+prio = load_sibling(__file__, "4_priority_queue.py")
+via_queues = load_sibling(__file__, "../2_stacks/10_stack_via_two_queues.py")
+
+DEPTH = 1_000  # items kept in the queue during the fifo section
+
+def _timed(run: Callable[[], None]) -> float:
+    t0 = time.perf_counter()
+    run()
+    return time.perf_counter() - t0
+
+# -- fifo -------------------------------------------------------------------------
+
+def _fifo_single(put: Callable, get: Callable, n: int) -> Callable[[], None]:
+    def run():
+        for i in range(n):
+            put(i)
+            get()
+    return run
+
+def _fifo_batched(put_many: Callable, get_many: Callable, n: int, batch: int) -> Callable[[], None]:
+    def run():
+        for lo in range(0, n, batch):
+            put_many(range(lo, min(n, lo + batch)))
+            get_many(min(batch, n - lo))
+    return run
+
+def fifo_cases(n: int, batch: int) -> Dict[str, Callable[[], Callable[[], None]]]:
+    # each factory builds a fresh queue prefilled to DEPTH and returns the timed closure
+    def prefill(put):
+        for i in range(DEPTH):
+            put(i)
+
+    def deque_case():
+        d = deque(); prefill(d.append)
+        return _fifo_single(d.append, d.popleft, n)
+
+    def deque_batched():
+        d = deque(); prefill(d.append)
+        popleft = d.popleft
+        return _fifo_batched(d.extend, lambda k: [popleft() for _ in range(k)], n, batch)
+
+    def queue_case():
+        q = queue.Queue(); prefill(q.put)
+        return _fifo_single(q.put, q.get, n)
+
+    def ring_case(typecode=None):
+        q = ring.RingBufferQueue(typecode=typecode); prefill(q.enqueue)
+        return _fifo_single(q.enqueue, q.dequeue, n)
+
+    def ring_batched(typecode=None):
+        q = ring.RingBufferQueue(typecode=typecode); prefill(q.enqueue)
+        return _fifo_batched(q.put_many, q.get_many, n, batch)
+
+    def spsc_case():
+        q = spsc.SPSCQueue(DEPTH + batch); prefill(q.put)
+        return _fifo_single(q.try_put, q.try_get, n)
+
+    def spsc_batched():
+        q = spsc.SPSCQueue(DEPTH + batch); prefill(q.put)
+        return _fifo_batched(q.put_many, q.get_many, n, batch)
+
+    def blocking_case():
+        q = mpmc.BlockingQueue(); prefill(q.put)
+        return _fifo_single(q.put, q.get, n)
+
+    def blocking_batched():
+        q = mpmc.BlockingQueue(); prefill(q.put)
+        return _fifo_batched(q.put_many, q.get_many, n, batch)
+
+    return {
+        "deque": deque_case,
+        "deque (batch)": deque_batched,
+        "queue.Queue": queue_case,
+        "RingBufferQueue": ring_case,
+        "RingBufferQueue (batch)": ring_batched,
+        "RingBufferQueue[q] (batch)": lambda: ring_batched("q"),
+        "SPSCQueue": spsc_case,
+        "SPSCQueue (batch)": spsc_batched,
+        "BlockingQueue": blocking_case,
+        "BlockingQueue (batch)": blocking_batched,
+    }
+
+# -- threads ----------------------------------------------------------------------
+
+def _threaded(q, producers: int, consumers: int, n: int, batch: int) -> Callable[[], None]:
+    per_producer = n // producers
+    total = per_producer * producers
+    quotas = [total // consumers + (i < total % consumers) for i in range(consumers)]
+    put_many = getattr(q, "put_many", None)
+    get_many = getattr(q, "get_many", None)
+
+    def producer():
+        if batch > 1 and put_many:
+            for lo in range(0, per_producer, batch):
+                put_many(range(lo, min(per_producer, lo + batch)), timeout=30)
+        else:
+            put = q.put
+            for i in range(per_producer):
+                put(i, timeout=30)
+
+    def consumer(quota: int):
+        if batch > 1 and get_many:
+            while quota:
+                quota -= len(get_many(min(batch, quota), timeout=30))
+        else:
+            get = q.get
+            for _ in range(quota):
+                get(timeout=30)
+
+    def run():
+        ts = [threading.Thread(target=producer) for _ in range(producers)]
+        ts += [threading.Thread(target=consumer, args=(k,)) for k in quotas]
+        for t in ts: t.start()
+        for t in ts: t.join()
+    return run
+
+def thread_cases(n: int, batch: int) -> Dict[str, Callable[[], Callable[[], None]]]:
+    cap = 10_000
+    return {
+        "1x1 queue.Queue": lambda: _threaded(queue.Queue(cap), 1, 1, n, 1),
+        "1x1 SPSCQueue": lambda: _threaded(spsc.SPSCQueue(cap), 1, 1, n, 1),
+        "1x1 SPSCQueue (batch)": lambda: _threaded(spsc.SPSCQueue(cap), 1, 1, n, batch),
+        "1x1 BlockingQueue": lambda: _threaded(mpmc.BlockingQueue(cap), 1, 1, n, 1),
+        "1x1 BlockingQueue (batch)": lambda: _threaded(mpmc.BlockingQueue(cap), 1, 1, n, batch),
+        "4x4 queue.Queue": lambda: _threaded(queue.Queue(cap), 4, 4, n, 1),
+        "4x4 BlockingQueue": lambda: _threaded(mpmc.BlockingQueue(cap), 4, 4, n, 1),
+        "4x4 BlockingQueue (batch)": lambda: _threaded(mpmc.BlockingQueue(cap), 4, 4, n, batch),
+    }
+
+# -- priority ---------------------------------------------------------------------
+
+def priority_cases(n: int, batch: int) -> Dict[str, Callable[[], Callable[[], None]]]:
+    rng = random.Random(0)
+    prios = [rng.random() for _ in range(n)]
+
+    def heapq_case():
+        def run():
+            h: list = []
+            for i, p in enumerate(prios):
+                heapq.heappush(h, (p, i))
+            while h:
+                heapq.heappop(h)
+        return run
+
+    def queue_case():
+        def run():
+            q = queue.PriorityQueue()
+            for i, p in enumerate(prios):
+                q.put((p, i))
+            for _ in range(n):
+                q.get()
+        return run
+
+    def pq_case():
+        def run():
+            q = prio.PriorityQueue()
+            for i, p in enumerate(prios):
+                q.push(i, p)
+            for _ in range(n):
+                q.pop()
+        return run
+
+    def pq_bulk():
+        def run():
+            q = prio.PriorityQueue()
+            q.push_many(zip(range(n), prios))
+            for _ in range(n):
+                q.pop()
+        return run
+
+    return {"heapq": heapq_case, "queue.PriorityQueue": queue_case,
+            "PriorityQueue": pq_case, "PriorityQueue (push_many)": pq_bulk}
+
+# -- lifo -------------------------------------------------------------------------
+
+def lifo_cases(n: int, batch: int) -> Dict[str, Callable[[], Callable[[], None]]]:
+    def stack_run(push, pop, size):
+        def run():
+            for i in range(size):
+                push(i)
+            for _ in range(size):
+                pop()
+        return run
+
+    def deque_case():
+        d = deque()
+        return stack_run(d.append, d.pop, n)
+
+    def via(strategy, size):
+        s = via_queues.StackViaQueues(strategy)
+        return stack_run(s.push, s.pop, size)
+
+    # rotate is O(n) per push: keep its size small, the per-item rate is still comparable
+    return {"deque (as stack)": deque_case,
+            "StackViaQueues nested": lambda: via("nested", n),
+            "StackViaQueues rotate": lambda: via("rotate", min(n, 2_000))}
+
+SECTIONS = {"fifo": fifo_cases, "threads": thread_cases,
+            "priority": priority_cases, "lifo": lifo_cases}
+
+def _items(section: str, name: str, n: int) -> int:
+    if section == "threads":
+        return n - n % (4 if name.startswith("4x4") else 1)
+    if section == "lifo" and "rotate" in name:
+        return min(n, 2_000)
+    return n
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--section", nargs="+", default=list(SECTIONS), choices=list(SECTIONS))
+    p.add_argument("--items", type=int, default=200_000)
+    p.add_argument("--batch", type=int, default=256, help="items per put_many/get_many")
+    p.add_argument("--repeats", type=int, default=3)
+    args = p.parse_args(argv)
+    for section in args.section:
+        print(f"== {section} ({args.items:,} items)")
+        for name, make in SECTIONS[section](args.items, args.batch).items():
+            # a fresh queue per repeat, built outside the timed region
+            dt = min(_timed(make()) for _ in range(args.repeats))
+            print(f"  {name:<28} {_items(section, name, args.items) / dt:>14,.0f} items/s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
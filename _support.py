@@ -0,0 +1,42 @@
+"""
+Helpers shared by the example folders: loading numbered sibling files, and the
+deadline arithmetic behind the blocking calls' timeouts.
+The example files start with a digit, so they cannot be imported by name: a file that
+needs this module puts the repository root on sys.path first, then imports it.
+"""
+from __future__ import annotations
+import importlib.util, sys, time
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+def load_sibling(anchor: str, path: str) -> ModuleType:
+    """Import the file at `path` (relative to the folder of `anchor`, usually __file__).
+    Every caller gets the same module object: it is registered in sys.modules under a
+    name derived from the file's resolved location."""
+    full = (Path(anchor).resolve().parent / path).resolve()
+    name = f"_{full.parent.name}__{full.stem}"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, full)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod  # dataclasses resolve annotations through sys.modules
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+def deadline_after(timeout: Optional[float]) -> Optional[float]:
+    """Monotonic deadline for a blocking call; None (no timeout) waits forever."""
+    return None if timeout is None else time.monotonic() + timeout
+
+def time_left(deadline: Optional[float], what: str) -> Optional[float]:
+    """Seconds until `deadline`, to pass to a wait(); raises TimeoutError once it passed."""
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise TimeoutError(f"{what} timed out")
+    return left